@@ -0,0 +1,66 @@
+"""
+────────────────────────────────────────────────────────────
+Minesweeper – Batch Throughput Benchmark
+────────────────────────────────────────────────────────────
+Measures boards per second for:
+  - minesweeper() called once per board (list of lists)
+  - annotate_boards() on a stacked batch of boards
+  - random_boards() (board generation alone)
+
+Usage:
+  python benchmark_minesweeper_batch.py
+  python benchmark_minesweeper_batch.py --boards 1000000
+────────────────────────────────────────────────────────────
+"""
+
+import argparse
+import time
+
+from minesweeper import minesweeper
+from minesweeper_batch import annotate_boards, random_boards, to_grid
+
+# Small board shapes produced by the level generator
+SHAPES = [(8, 8), (16, 16), (30, 16)]
+
+
+def boards_per_second(func, count):
+    """Call func() once and return count / elapsed seconds."""
+    start = time.perf_counter()
+    func()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched minesweeper annotation.")
+    parser.add_argument("--boards", type=int, default=100_000, help="boards per batch")
+    parser.add_argument("--single-boards", type=int, default=1_000,
+                        help="boards for the one-at-a-time minesweeper() measurement")
+    parser.add_argument("--density", type=float, default=0.15)
+    args = parser.parse_args()
+
+    print(f"{'Shape':<10}{'minesweeper()':>18}{'annotate_boards()':>20}{'random_boards()':>18}{'Speed-up':>10}")
+    print("-" * 76)
+
+    for rows, cols in SHAPES:
+        mines = random_boards(args.boards, rows, cols, args.density, seed=1)
+
+        # Check the batch result against minesweeper() on a few boards
+        annotated = annotate_boards(mines[:10])
+        grids = [[["#" if cell else "-" for cell in row] for row in board] for board in mines[:args.single_boards].tolist()]
+        for board, grid in zip(annotated, grids):
+            assert to_grid(board) == minesweeper(grid)
+
+        single = boards_per_second(lambda: [minesweeper(grid) for grid in grids], len(grids))
+        batch = boards_per_second(lambda: annotate_boards(mines), args.boards)
+        generate = boards_per_second(lambda: random_boards(args.boards, rows, cols, args.density, seed=2),
+                                     args.boards)
+
+        print(f"{f'{rows}x{cols}':<10}{single:>18,.0f}{batch:>20,.0f}{generate:>18,.0f}{batch / single:>9.0f}x")
+
+    print("\n(boards per second)")
+
+
+if __name__ == "__main__":
+    main()
+
+# --------------------- END OF CODE ------------------------
@@ -0,0 +1,118 @@
+"""
+────────────────────────────────────────────────────────────
+Minesweeper – Batch Annotation
+────────────────────────────────────────────────────────────
+Vectorised version of minesweeper() for many boards of the
+same shape at once. Boards are stacked into one 3D NumPy
+array of shape (boards, rows, cols) and every neighbour count
+is computed in a single pass:
+
+  1. pad each board with a border of empty cells
+  2. add the three columns of each 3 x 3 window (horizontal)
+  3. add the three rows of that result (vertical)
+  4. subtract the cell itself
+
+Mines are marked with MINE (-1) in the result instead of '#'.
+────────────────────────────────────────────────────────────
+"""
+
+import numpy as np
+
+# Value used for mine cells in annotated boards
+MINE = -1
+
+
+def annotate_boards(mines):
+    """
+    Takes a boolean array of mines, shape (boards, rows, cols) or (rows, cols).
+    Returns an int8 array of the same shape where:
+      - mine cells are MINE (-1)
+      - other cells hold the number of adjacent mines (0-8).
+    """
+    mines = np.asarray(mines, dtype=bool)
+    single = mines.ndim == 2
+    if single:
+        mines = mines[np.newaxis]
+    if mines.ndim != 3:
+        raise ValueError("mines must have shape (boards, rows, cols) or (rows, cols).")
+
+    boards, rows, cols = mines.shape
+
+    # Pad with empty cells so every cell has 8 neighbours
+    padded = np.zeros((boards, rows + 2, cols + 2), dtype=np.int8)
+    padded[:, 1:-1, 1:-1] = mines
+
+    # Sum each row of three cells, then each column of three row sums
+    horizontal = padded[:, :, :-2] + padded[:, :, 1:-1]
+    horizontal += padded[:, :, 2:]
+    counts = horizontal[:, :-2] + horizontal[:, 1:-1]
+    counts += horizontal[:, 2:]
+
+    # The 3 x 3 sum includes the cell itself
+    counts -= padded[:, 1:-1, 1:-1]
+    counts[mines] = MINE
+
+    return counts[0] if single else counts
+
+
+def random_boards(count, rows, cols, density=0.15, seed=None):
+    """
+    Generate `count` random boards as a boolean array (count, rows, cols).
+    Each cell is a mine with probability `density`; the same seed always
+    gives the same boards.
+    """
+    if not 0.0 <= density <= 1.0:
+        raise ValueError("density must be between 0 and 1.")
+
+    rng = np.random.default_rng(seed)
+    return rng.random((count, rows, cols), dtype=np.float32) < density
+
+
+def generate_annotated(count, rows, cols, density=0.15, seed=None, batch_size=100_000):
+    """
+    Yield (mines, counts) pairs of at most batch_size boards until `count`
+    boards have been produced, so millions of boards never have to be in
+    memory at once.
+    """
+    rng = np.random.default_rng(seed)
+    produced = 0
+    while produced < count:
+        size = min(batch_size, count - produced)
+        mines = rng.random((size, rows, cols), dtype=np.float32) < density
+        yield mines, annotate_boards(mines)
+        produced += size
+
+
+# ---------------------------------------------------------
+# Conversion to and from the list-of-lists format
+# ---------------------------------------------------------
+def boards_from_grids(grids):
+    """Convert grids of '#' and '-' (as used by minesweeper()) to a mine array."""
+    return np.array([[[cell == "#" for cell in row] for row in grid] for grid in grids], dtype=bool)
+
+
+def to_grid(counts):
+    """
+    Convert one annotated board back to the minesweeper() format:
+    '#' for mines and integers for the other cells.
+    """
+    return [["#" if value == MINE else value for value in row] for row in counts.tolist()]
+
+
+# Example usage
+if __name__ == "__main__":
+    input_grid = [
+        ["-", "-", "-", "#", "#"],
+        ["-", "#", "-", "-", "-"],
+        ["-", "-", "#", "-", "-"],
+        ["-", "#", "#", "-", "-"],
+        ["-", "-", "-", "-", "-"]
+    ]
+
+    annotated = annotate_boards(boards_from_grids([input_grid]))
+
+    # Print the result in a readable way
+    for row in to_grid(annotated[0]):
+        print(row)
+
+# --------------------- END OF CODE ------------------------
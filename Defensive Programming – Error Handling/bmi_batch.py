@@ -0,0 +1,184 @@
+"""
+===========================================================
+ Batch BMI Calculator
+-----------------------------------------------------------
+ File:    bmi_batch.py
+ Version: 1.0
+ Date:    19/10/2026
+ Author:  Annelli
+
+ Description:
+     Vectorised companion to calculate_bmi() in logic.py for
+     large population datasets. Instead of printing an error
+     and returning None for each bad row, the batch functions
+     return three NumPy arrays of equal length:
+
+         bmi     – float64 BMI values (NaN where invalid)
+         valid   – boolean mask of rows with a usable BMI
+         reason  – uint8 reason code for every row
+
+     CSV files are processed in chunks, so files with tens of
+     millions of rows never have to fit in memory at once.
+
+ Requirements:
+     • Python 3.x
+     • NumPy
+
+ Usage Example:
+     result = calculate_bmi_batch([70, 80], [1.75, 0])
+     result.bmi      # array([22.857..., nan])
+     result.reason   # array([0, 2], dtype=uint8)
+
+     for chunk in bmi_from_csv("population.csv"):
+         ...
+
+ Notes:
+     • Uses the correct formula, weight / height ** 2. The
+       swapped formula in logic.py is a deliberate teaching
+       example of a logical error and is left unchanged there.
+===========================================================
+"""
+
+import csv
+import itertools
+import sys
+from collections import namedtuple
+
+import numpy as np
+
+# ---------------------------------------------------------
+# Reason codes
+# ---------------------------------------------------------
+VALID = 0
+INVALID_TYPE = 1          # non-numeric, missing or non-finite value
+NON_POSITIVE_HEIGHT = 2
+NON_POSITIVE_WEIGHT = 3
+
+REASON_MESSAGES = {
+    VALID: "Valid.",
+    INVALID_TYPE: "Invalid input type. Please provide numeric values for weight and height.",
+    NON_POSITIVE_HEIGHT: "Height must be greater than zero.",
+    NON_POSITIVE_WEIGHT: "Weight must be greater than zero.",
+}
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+BmiBatch = namedtuple("BmiBatch", ["bmi", "valid", "reason"])
+
+
+# ---------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------
+def _to_float_column(values):
+    """
+    Convert a column to float64. Values that cannot be converted become NaN,
+    so they are reported as INVALID_TYPE rather than raising.
+    """
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        pass
+
+    # Slow path: at least one value is not numeric
+    column = np.empty(len(values), dtype=np.float64)
+    for i, value in enumerate(values):
+        try:
+            column[i] = float(value)
+        except (TypeError, ValueError):
+            column[i] = np.nan
+    return column
+
+
+# ---------------------------------------------------------
+# Batch API
+# ---------------------------------------------------------
+def calculate_bmi_batch(weights, heights):
+    """
+    Calculate BMI for whole columns of weights (kg) and heights (m).
+
+    Returns a BmiBatch of (bmi, valid, reason) arrays. Invalid rows get a
+    NaN BMI and a reason code instead of printing an error.
+    """
+    weights = _to_float_column(weights)
+    heights = _to_float_column(heights)
+
+    if weights.shape != heights.shape:
+        raise ValueError("weights and heights must have the same length.")
+
+    reason = np.zeros(weights.shape, dtype=np.uint8)
+
+    # Assign the least specific reason first so more specific ones win
+    reason[weights <= 0] = NON_POSITIVE_WEIGHT
+    reason[heights <= 0] = NON_POSITIVE_HEIGHT
+    reason[~(np.isfinite(weights) & np.isfinite(heights))] = INVALID_TYPE
+
+    valid = reason == VALID
+
+    bmi = np.full(weights.shape, np.nan)
+    np.divide(weights, heights * heights, out=bmi, where=valid)
+
+    return BmiBatch(bmi, valid, reason)
+
+
+def bmi_from_csv(path, weight_column="weight", height_column="height",
+                 chunk_size=DEFAULT_CHUNK_SIZE, delimiter=","):
+    """
+    Stream BMI results for a large CSV file, one BmiBatch per chunk of rows.
+
+    The file must have a header row containing weight_column and
+    height_column. Short rows are treated as missing values.
+    """
+    with open(path, "r", newline="") as file:
+        reader = csv.reader(file, delimiter=delimiter)
+
+        header = next(reader, None)
+        if header is None:
+            return
+
+        try:
+            weight_index = header.index(weight_column)
+            height_index = header.index(height_column)
+        except ValueError:
+            raise ValueError(f"CSV header must contain '{weight_column}' and '{height_column}'.") from None
+
+        needed = max(weight_index, height_index) + 1
+
+        while rows := list(itertools.islice(reader, chunk_size)):
+            weights = [row[weight_index] if len(row) >= needed else "" for row in rows]
+            heights = [row[height_index] if len(row) >= needed else "" for row in rows]
+            yield calculate_bmi_batch(weights, heights)
+
+
+def reason_counts(reason):
+    """Return {reason_code: number_of_rows} for a reason array."""
+    counts = np.bincount(reason, minlength=len(REASON_MESSAGES))
+    return {code: int(counts[code]) for code in REASON_MESSAGES}
+
+
+# ---------------------------------------------------------
+# Command-line summary of a CSV file
+# ---------------------------------------------------------
+def main(path):
+    totals = dict.fromkeys(REASON_MESSAGES, 0)
+    bmi_sum = 0.0
+
+    for chunk in bmi_from_csv(path):
+        bmi_sum += float(chunk.bmi[chunk.valid].sum())
+        for code, count in reason_counts(chunk.reason).items():
+            totals[code] += count
+
+    print(f"{'Reason':<80}{'Rows':>12}")
+    print("-" * 92)
+    for code, count in totals.items():
+        print(f"{REASON_MESSAGES[code]:<80}{count:>12,}")
+
+    if totals[VALID]:
+        print(f"\nMean BMI of valid rows: {bmi_sum / totals[VALID]:.2f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        raise SystemExit("Usage: python bmi_batch.py <file.csv>")
+    main(sys.argv[1])
+
+# =================== END OF CODE ===================
@@ -34,14 +34,16 @@ calculate_bmi(weight, invalid_height)
 '''
 
 # Main program to get user input and display BMI
-print("Welcome to the BMI Calculator!\n")
+# (only runs when this file is executed, so calculate_bmi() can be imported)
+if __name__ == "__main__":
+    print("Welcome to the BMI Calculator!\n")
 
-weight = float(input("Please enter your weight in kg: \n"))
-height = float(input("\nPlease enter your height in meters: \n"))
+    weight = float(input("Please enter your weight in kg: \n"))
+    height = float(input("\nPlease enter your height in meters: \n"))
 
-bmi = calculate_bmi(weight, height)
-    
-if bmi is not None:
-    print(f"Your BMI is: {bmi:.2f}")
+    bmi = calculate_bmi(weight, height)
+
+    if bmi is not None:
+        print(f"Your BMI is: {bmi:.2f}")
 
 # =================== END OF CODE ===================
@@ -67,77 +67,106 @@ def get_choice(prompt, valid_choices):
 
 
 # -------------------------------------------------------------
-# Display menu
+# Financial formulas
 # -------------------------------------------------------------
-print("""
+def simple_interest(principal, rate, years):
+    """Total value after simple interest. rate is a fraction (e.g. 0.08)."""
+    return principal * (1 + (rate * years))
+
+
+def compound_interest(principal, rate, years, periods_per_year=1):
+    """Total value after compound interest. rate is a fraction (e.g. 0.08)."""
+    return principal * math.pow((1 + (rate / periods_per_year)), (periods_per_year * years))
+
+
+def bond_repayment(principal, rate_percent, months):
+    """Monthly repayment on a bond. rate_percent is the annual rate in %."""
+    monthly_rate = (rate_percent / 100) / 12
+    return (monthly_rate * principal) / (1 - (1 + monthly_rate)**(-months))
+
+
+# -------------------------------------------------------------
+# Main program
+# -------------------------------------------------------------
+def main():
+    """Run the interactive investment / bond calculator."""
+
+    # -------------------------------------------------------------
+    # Display menu
+    # -------------------------------------------------------------
+    print("""
 Investment calculator: to calculate your ROI
 Bond calculator: to calculate the monthly repayment on your bond
 """)
 
-# -------------------------------------------------------------
-# Main loop for calculator type
-# -------------------------------------------------------------
-user_input = get_choice("Enter either 'Investment' or 'Bond' from the menu above to proceed: \n", ["Investment", "Bond"])
+    # -------------------------------------------------------------
+    # Main loop for calculator type
+    # -------------------------------------------------------------
+    user_input = get_choice("Enter either 'Investment' or 'Bond' from the menu above to proceed: \n", ["Investment", "Bond"])
 
 
-# -----------------------------
-# Investment calculator
-# -----------------------------
-if user_input == "Investment":
-    principal = get_float("\nEnter the principal investment amount (R): \n")
-    rate_input = get_float("\nEnter the rate of interest (%): \n")
-    period = get_int("\nEnter the total investment period (years): \n")
-    interest_type = get_choice("\nEnter 'Simple' or 'Compound' to choose your interest type: \n", ["Simple", "Compound"])
-    
-    rate = rate_input / 100
-    
-    # -----------------------------
-    # Simple interest calculation
-    # -----------------------------
-    if interest_type == "Simple":
-        simple_roi = principal * (1 + (rate * period))
-        print(f"\nYour total ROI after {period} years will be: R{simple_roi:.2f}")
-    
     # -----------------------------
-    # Compound interest calculation
+    # Investment calculator
     # -----------------------------
-    else: # Compound
-        compound_frequency = get_choice("\nShould the interest be monthly or yearly compounding? Enter 'Monthly' or 'Yearly' to select your choice: \n", ["Monthly", "Yearly"])
-        
-        if compound_frequency == "Monthly": # Monthly compounding
-            compound_roi = principal * math.pow((1 + (rate / 12)),(12 * period))
-        
-        else: # Yearly compounding
-            compound_roi = principal * math.pow((1 + rate), period)
-        
-        print(f"\nYour total ROI after {period} years will be: R{compound_roi:.2f}")
-
-
-# -----------------------------
-# Bond calculator
-# -----------------------------
-elif user_input == "Bond":
-    principal = get_float("\nEnter the bond principal amount (R): \n")
-    rate = get_float("\nEnter the rate of interest (%): \n")
-    period_type = get_choice("\nWould you like your bond period to be defined in 'Years' or 'Months': \n", ["Years", "Months"])
-    
-    # -----------------------------
-    # User defined Period in Years
-    # -----------------------------
-    if period_type == "Years": 
-        period_years = get_int("\nEnter the total bond period (Years): \n")
-        period = period_years * 12 # Convert to Months
-    
+    if user_input == "Investment":
+        principal = get_float("\nEnter the principal investment amount (R): \n")
+        rate_input = get_float("\nEnter the rate of interest (%): \n")
+        period = get_int("\nEnter the total investment period (years): \n")
+        interest_type = get_choice("\nEnter 'Simple' or 'Compound' to choose your interest type: \n", ["Simple", "Compound"])
+
+        rate = rate_input / 100
+
+        # -----------------------------
+        # Simple interest calculation
+        # -----------------------------
+        if interest_type == "Simple":
+            simple_roi = simple_interest(principal, rate, period)
+            print(f"\nYour total ROI after {period} years will be: R{simple_roi:.2f}")
+
+        # -----------------------------
+        # Compound interest calculation
+        # -----------------------------
+        else: # Compound
+            compound_frequency = get_choice("\nShould the interest be monthly or yearly compounding? Enter 'Monthly' or 'Yearly' to select your choice: \n", ["Monthly", "Yearly"])
+
+            if compound_frequency == "Monthly": # Monthly compounding
+                compound_roi = compound_interest(principal, rate, period, 12)
+
+            else: # Yearly compounding
+                compound_roi = compound_interest(principal, rate, period)
+
+            print(f"\nYour total ROI after {period} years will be: R{compound_roi:.2f}")
+
+
     # -----------------------------
-    # User defined Period in Months
+    # Bond calculator
     # -----------------------------
-    else:
-        period = get_int("\nEnter the total bond period (Months): \n")
+    elif user_input == "Bond":
+        principal = get_float("\nEnter the bond principal amount (R): \n")
+        rate = get_float("\nEnter the rate of interest (%): \n")
+        period_type = get_choice("\nWould you like your bond period to be defined in 'Years' or 'Months': \n", ["Years", "Months"])
+
+        # -----------------------------
+        # User defined Period in Years
+        # -----------------------------
+        if period_type == "Years":
+            period_years = get_int("\nEnter the total bond period (Years): \n")
+            period = period_years * 12 # Convert to Months
+
+        # -----------------------------
+        # User defined Period in Months
+        # -----------------------------
+        else:
+            period = get_int("\nEnter the total bond period (Months): \n")
+
+        monthly_repayment = bond_repayment(principal, rate, period)
+
+        print(f"\nYour total monthly repayment will be: R{monthly_repayment:.2f}")
 
-    monthly_rate = (rate / 100) / 12
-    monthly_repayment = (monthly_rate * principal) / (1 - (1 + monthly_rate)**(-period))
 
-    print(f"\nYour total monthly repayment will be: R{monthly_repayment:.2f}")
+# Run the program
+if __name__ == "__main__":
+    main()
 
 
 # ----------------------- END OF CODE -------------------------
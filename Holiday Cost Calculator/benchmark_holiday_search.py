@@ -0,0 +1,91 @@
+"""
+===========================================================
+ Holiday Budget Search Benchmark
+-----------------------------------------------------------
+ File: benchmark_holiday_search.py
+ Version: 1.0
+ Date: 19/10/2026
+ Author: Annelli
+
+ Description:
+     Measures budget queries per second for
+     HolidaySearch.summarise_many() and compares it with a
+     brute-force search that prices every combination with
+     holiday_cost(). The brute-force results are also used
+     to check the closed-form answers.
+
+ Usage Example:
+     python benchmark_holiday_search.py
+     python benchmark_holiday_search.py --queries 100000
+===========================================================
+"""
+
+import argparse
+import random
+import time
+
+from holiday import FLIGHT_PRICES, holiday_cost
+from holiday_search import HolidaySearch
+
+
+def brute_force_summary(budget, max_nights, max_days):
+    """Count and find the cheapest/longest itinerary by pricing every combination."""
+    count = 0
+    cheapest = longest = None
+    for city in FLIGHT_PRICES:
+        for nights in range(1, max_nights + 1):
+            for days in range(1, max_days + 1):
+                cost = holiday_cost(nights, city, days)
+                if cost > budget:
+                    continue
+                count += 1
+                if cheapest is None or cost < cheapest:
+                    cheapest = cost
+                if longest is None or (nights, days) > longest:
+                    longest = (nights, days)
+    return count, cheapest, longest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the holiday budget search.")
+    parser.add_argument("--queries", type=int, default=10_000)
+    parser.add_argument("--brute-force-queries", type=int, default=20)
+    parser.add_argument("--max-budget", type=int, default=50_000)
+    args = parser.parse_args()
+
+    rng = random.Random(2026)
+    budgets = [rng.randint(0, args.max_budget) for _ in range(args.queries)]
+
+    start = time.perf_counter()
+    search = HolidaySearch()
+    setup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    summaries = search.summarise_many(budgets)
+    fast = time.perf_counter() - start
+
+    # Brute force on a sample, bounded by the most the largest budget can buy
+    max_nights = args.max_budget // search.night_rate
+    max_days = args.max_budget // search.day_rate
+    sample = list(zip(budgets, summaries))[:args.brute_force_queries]
+
+    start = time.perf_counter()
+    for budget, summary in sample:
+        count, cheapest, longest = brute_force_summary(budget, max_nights, max_days)
+        assert count == summary.count
+        assert cheapest == (summary.cheapest.cost if summary.cheapest else None)
+        assert longest == ((summary.longest.nights, summary.longest.rental_days) if summary.longest else None)
+    slow = (time.perf_counter() - start) / max(len(sample), 1) * args.queries
+
+    print(f"Budgets R0 - R{args.max_budget:,}   (fare table built in {setup * 1000:.3f} ms)\n")
+    print(f"{'Method':<28}{'Queries/s':>14}{'Time for ' + format(args.queries, ',') + ' queries':>28}")
+    print("-" * 70)
+    print(f"{'Closed form (batch)':<28}{args.queries / fast:>14,.0f}{fast:>26.3f} s")
+    print(f"{'Brute force (estimated)':<28}{args.queries / slow:>14,.0f}{slow:>26.3f} s")
+    print(f"\nResults match brute force on {len(sample)} budgets.")
+
+
+if __name__ == "__main__":
+    main()
+
+# --------------------- END OF CODE -----------------------
@@ -24,6 +24,17 @@
 ===========================================================
 """
 
+# ---------------------------------------------------------
+# Flight prices
+# ---------------------------------------------------------
+FLIGHT_PRICES = {
+    "Cape Town": 2500,
+    "Johannesburg": 1800,
+    "Durban": 2000,
+    "Bloemfontein": 2200
+}
+
+
 # ---------------------------------------------------------
 # Functions 
 # ---------------------------------------------------------
@@ -35,13 +46,7 @@ def hotel_cost(num_nights):
 
 def plane_cost(city_flight):
     """Return the flight cost for a valid city."""
-    flight_prices = {
-        "Cape Town": 2500,
-        "Johannesburg": 1800,
-        "Durban": 2000,
-        "Bloemfontein": 2200
-    }
-    return flight_prices[city_flight.title()]
+    return FLIGHT_PRICES[city_flight.title()]
 
 
 def car_rental(rental_days):
@@ -59,7 +64,7 @@ def holiday_cost(num_nights, city_flight, rental_days):
 # ---------------------------------------------------------
 def get_valid_city():
     """Prompt user until a valid city is entered."""
-    valid_cities = ["Cape Town", "Johannesburg", "Durban", "Bloemfontein"]
+    valid_cities = list(FLIGHT_PRICES)
 
     while True:
         city = input("Enter the city you will be flying to (Cape Town, Johannesburg, Durban, Bloemfontein): ").strip().title()
@@ -85,27 +90,29 @@ def get_positive_int(prompt):
 # ---------------------------------------------------------
 # Main Program
 # ---------------------------------------------------------
-print("Welcome to the Holiday Cost Calculator!\n")
-
-# ---------------------------
-# Get validated user inputs
-# ---------------------------
-city_flight = get_valid_city()
-num_nights = get_positive_int("Enter the number of nights you will stay at the hotel: ")
-rental_days = get_positive_int("Enter the number of days you will rent a car: ")
-
-# ---------------------------
-# Calculate costs
-# ---------------------------
-total_hotel = hotel_cost(num_nights)
-total_plane = plane_cost(city_flight)
-total_car = car_rental(rental_days)
-total_holiday = holiday_cost(num_nights, city_flight, rental_days)
-
-# ---------------------------
-# Print details
-# ---------------------------
-print(f"""
+def main():
+    """Run the interactive holiday cost calculator."""
+    print("Welcome to the Holiday Cost Calculator!\n")
+
+    # ---------------------------
+    # Get validated user inputs
+    # ---------------------------
+    city_flight = get_valid_city()
+    num_nights = get_positive_int("Enter the number of nights you will stay at the hotel: ")
+    rental_days = get_positive_int("Enter the number of days you will rent a car: ")
+
+    # ---------------------------
+    # Calculate costs
+    # ---------------------------
+    total_hotel = hotel_cost(num_nights)
+    total_plane = plane_cost(city_flight)
+    total_car = car_rental(rental_days)
+    total_holiday = holiday_cost(num_nights, city_flight, rental_days)
+
+    # ---------------------------
+    # Print details
+    # ---------------------------
+    print(f"""
 {'=' * 55}
 { 'Holiday Cost Summary'.center(55)}
 {'-' * 55}
@@ -119,4 +126,8 @@ print(f"""
 """)
 
 
+# Run the program
+if __name__ == "__main__":
+    main()
+
 # --------------------- END OF CODE -----------------------
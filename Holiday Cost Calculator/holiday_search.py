@@ -0,0 +1,209 @@
+"""
+===========================================================
+ Holiday Budget Search
+-----------------------------------------------------------
+ File: holiday_search.py
+ Version: 1.0
+ Date: 19/10/2026
+ Author: Annelli
+
+ Description:
+     Answers the reverse question of holiday.py: "what can
+     I afford for a given budget?". An itinerary is a
+     (city, nights, rental_days) combination with at least
+     one night and one rental day, priced with hotel_cost(),
+     plane_cost() and car_rental().
+
+     Because every cost is linear, no brute-force search is
+     needed:
+         • Cities are kept in a fare table sorted by the
+           cheapest possible trip (flight + 1 night + 1 day),
+           so the affordable cities are found with a binary
+           search.
+         • The cheapest itinerary is the first affordable
+           city with 1 night and 1 rental day.
+         • The longest itinerary (most nights, then most
+           rental days) always uses the cheapest flight, with
+           nights and days given by integer division.
+         • The number of itineraries is a sum of floor
+           divisions, evaluated in closed form.
+
+     Every cost is a whole number of rands, so budgets are
+     floored to whole rands before they are searched.
+
+ Usage Example:
+     search = HolidaySearch()
+     search.summarise(20000)
+     search.summarise_many([5000, 12000, 20000])
+     list(search.itineraries(6000))
+===========================================================
+"""
+
+import bisect
+import math
+from collections import namedtuple
+
+from holiday import FLIGHT_PRICES, car_rental, get_positive_int, hotel_cost, plane_cost
+
+Itinerary = namedtuple("Itinerary", ["city", "nights", "rental_days", "cost"])
+BudgetSummary = namedtuple("BudgetSummary", ["budget", "count", "cheapest", "longest"])
+
+
+# ---------------------------------------------------------
+# Closed-form helper
+# ---------------------------------------------------------
+def floor_sum(n, m, a, b):
+    """
+    Return sum(floor((a * i + b) / m) for i in range(n)) in O(log m) steps.
+    Requires n >= 0, m >= 1, a >= 0 and b >= 0.
+    """
+    total = 0
+    while True:
+        if a >= m:
+            total += (n - 1) * n // 2 * (a // m)
+            a %= m
+        if b >= m:
+            total += n * (b // m)
+            b %= m
+
+        y_max = a * n + b
+        if y_max < m:
+            return total
+
+        # Swap the roles of the axes and continue with a smaller problem
+        n, b, m, a = y_max // m, y_max % m, a, m
+
+
+# ---------------------------------------------------------
+# Search
+# ---------------------------------------------------------
+class HolidaySearch:
+    """
+    Budget queries over all (city, nights, rental_days) itineraries.
+    The fare table is built once from holiday.py's prices.
+    """
+
+    def __init__(self, cities=None):
+        cities = list(FLIGHT_PRICES) if cities is None else cities
+
+        # The cost functions are linear, so their slopes are the daily rates
+        self.night_rate = hotel_cost(1) - hotel_cost(0)
+        self.day_rate = car_rental(1) - car_rental(0)
+        self.hotel_base = hotel_cost(0)
+        self.car_base = car_rental(0)
+
+        # (flight cost, city), cheapest flight first
+        self.fares = sorted((plane_cost(city), city) for city in cities)
+
+        # Cheapest possible trip per city (1 night, 1 day), in the same order
+        self.minimum_costs = [self._trip_cost(flight, 1, 1) for flight, _ in self.fares]
+
+    def _trip_cost(self, flight, nights, days):
+        return flight + self.hotel_base + self.night_rate * nights + self.car_base + self.day_rate * days
+
+    @staticmethod
+    def _whole_rands(budget):
+        """Floor the budget to whole rands, as every cost is a whole number."""
+        return math.floor(budget)
+
+    def _remaining(self, budget, flight):
+        """Budget left for nights and rental days after the flight and fixed costs."""
+        return budget - flight - self.hotel_base - self.car_base
+
+    def affordable_cities(self, budget):
+        """Return the (flight cost, city) pairs with at least one affordable itinerary."""
+        return self.fares[:bisect.bisect_right(self.minimum_costs, budget)]
+
+    # -----------------------------
+    # Single-budget queries
+    # -----------------------------
+    def cheapest(self, budget):
+        """The cheapest itinerary within budget, or None."""
+        budget = self._whole_rands(budget)
+        if not self.fares or self.minimum_costs[0] > budget:
+            return None
+        flight, city = self.fares[0]
+        return Itinerary(city, 1, 1, self.minimum_costs[0])
+
+    def longest(self, budget):
+        """
+        The itinerary with the most nights (then most rental days) within
+        budget, or None. The cheapest flight leaves the most money for both.
+        """
+        budget = self._whole_rands(budget)
+        if not self.fares or self.minimum_costs[0] > budget:
+            return None
+
+        flight, city = self.fares[0]
+        remaining = self._remaining(budget, flight)
+        nights = (remaining - self.day_rate) // self.night_rate
+        days = (remaining - self.night_rate * nights) // self.day_rate
+        return Itinerary(city, nights, days, self._trip_cost(flight, nights, days))
+
+    def count(self, budget):
+        """The number of itineraries within budget, without listing them."""
+        budget = self._whole_rands(budget)
+        total = 0
+        for flight, _ in self.affordable_cities(budget):
+            remaining = self._remaining(budget, flight)
+            max_nights = (remaining - self.day_rate) // self.night_rate
+
+            # sum over nights = 1..max_nights of (remaining - night_rate * nights) // day_rate,
+            # re-indexed from the longest stay so every term is non-negative
+            total += floor_sum(max_nights, self.day_rate, self.night_rate,
+                               remaining - self.night_rate * max_nights)
+        return total
+
+    def itineraries(self, budget):
+        """
+        Yield every itinerary within budget (cheapest flight first, then by
+        nights and rental days). Only affordable combinations are visited.
+        """
+        budget = self._whole_rands(budget)
+        for flight, city in self.affordable_cities(budget):
+            remaining = self._remaining(budget, flight)
+            max_nights = (remaining - self.day_rate) // self.night_rate
+            for nights in range(1, max_nights + 1):
+                max_days = (remaining - self.night_rate * nights) // self.day_rate
+                for days in range(1, max_days + 1):
+                    yield Itinerary(city, nights, days, self._trip_cost(flight, nights, days))
+
+    def summarise(self, budget):
+        """Count, cheapest and longest itinerary for one budget (floored to whole rands)."""
+        budget = self._whole_rands(budget)
+        return BudgetSummary(budget, self.count(budget), self.cheapest(budget), self.longest(budget))
+
+    # -----------------------------
+    # Batch queries
+    # -----------------------------
+    def summarise_many(self, budgets):
+        """Summaries for many budgets, in the order given."""
+        return [self.summarise(budget) for budget in budgets]
+
+
+# ---------------------------------------------------------
+# Main Program
+# ---------------------------------------------------------
+def main():
+    """Ask for a budget and show what it can buy."""
+    print("Welcome to the Holiday Budget Search!\n")
+
+    budget = get_positive_int("Enter your holiday budget (R): ")
+    summary = HolidaySearch().summarise(budget)
+
+    if summary.count == 0:
+        print(f"\nUnfortunately no holiday is available for R{budget}.")
+        return
+
+    print(f"\nR{budget} buys {summary.count:,} different holidays.\n")
+    print(f"{'':<10}{'City':<16}{'Nights':>8}{'Car days':>10}{'Cost (R)':>10}")
+    print("-" * 54)
+    for label, itinerary in (("Cheapest", summary.cheapest), ("Longest", summary.longest)):
+        print(f"{label:<10}{itinerary.city:<16}{itinerary.nights:>8}{itinerary.rental_days:>10}{itinerary.cost:>10}")
+
+
+# Run the program
+if __name__ == "__main__":
+    main()
+
+# --------------------- END OF CODE -----------------------
@@ -0,0 +1,101 @@
+"""
+===========================================================
+Arrow Pattern Benchmark
+-----------------------------------------------------------
+ File:    benchmark_pattern.py
+ Version: 1.0
+ Date:    19/10/2026
+ Author:  Annelli
+
+ Description:
+     Compares three ways of rendering the arrow pattern:
+
+         original       – the first print_pattern(), which
+                          built two lists of heights
+         print_pattern  – one print() per row
+         write_pattern  – buffered bulk writes
+
+     Output goes to a temporary file so the numbers do not
+     depend on the speed of the terminal. The output of all
+     three is checked to be identical.
+
+ Usage Example:
+     python benchmark_pattern.py
+     python benchmark_pattern.py --height 20000
+===========================================================
+"""
+
+import argparse
+import contextlib
+import filecmp
+import os
+import tempfile
+import time
+
+from pattern import print_pattern, write_pattern
+
+
+# ---------------------------------------------------------
+# The original implementation, kept for comparison
+# ---------------------------------------------------------
+def original_print_pattern(height, char="*"):
+    pattern = list(range(1, height + 1)) + list(range(height - 1, 0, -1))
+    for i in pattern:
+        print(char * i)
+
+
+# ---------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------
+def time_render(render, height, path):
+    """Render the pattern into path and return the elapsed seconds."""
+    with open(path, "w") as file:
+        start = time.perf_counter()
+        if render is write_pattern:
+            write_pattern(height, "*", file)
+        else:
+            with contextlib.redirect_stdout(file):
+                render(height, "*")
+            file.flush()
+        return time.perf_counter() - start
+
+
+# ---------------------------------------------------------
+# Main Program
+# ---------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the arrow pattern renderers.")
+    parser.add_argument("--height", type=int, default=5000)
+    args = parser.parse_args()
+
+    renderers = [
+        ("original", original_print_pattern),
+        ("print_pattern", print_pattern),
+        ("write_pattern", write_pattern),
+    ]
+
+    output_bytes = args.height * args.height + 2 * args.height - 1
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        results = []
+        for name, render in renderers:
+            path = os.path.join(directory, f"{name}.txt")
+            paths.append(path)
+            results.append((name, time_render(render, args.height, path)))
+
+        identical = all(filecmp.cmp(paths[0], path, shallow=False) for path in paths[1:])
+
+    baseline = results[0][1]
+    print(f"Height {args.height:,} ({output_bytes / 1e6:,.1f} MB of output)\n")
+    print(f"{'Renderer':<16}{'Seconds':>10}{'MB/s':>12}{'Speed-up':>10}")
+    print("-" * 48)
+    for name, elapsed in results:
+        print(f"{name:<16}{elapsed:>10.3f}{output_bytes / elapsed / 1e6:>12,.0f}{baseline / elapsed:>9.1f}x")
+    print(f"\nOutputs identical: {identical}")
+
+
+if __name__ == "__main__":
+    main()
+
+# ============== END OF CODE ==============
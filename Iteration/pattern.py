@@ -1,10 +1,98 @@
+import io
+import itertools
+import os
+import sys
+
+# Size of the output buffer used by write_pattern()
+BUFFER_SIZE = 1 << 20
+
+
+def row_lengths(height):
+    """Yield the row lengths of the arrow: 1, 2, ..., height, ..., 2, 1."""
+    return itertools.chain(range(1, height + 1), range(height - 1, 0, -1))
+
+
 # Function to print an arrow pattern
 def print_pattern(height, char="*"):
     """Prints a mirrored increasing/decreasing pattern."""
-    pattern = list(range(1, height + 1)) + list(range(height - 1, 0, -1))
-    for i in pattern:
+    for i in row_lengths(height):
         print(char * i)
 
 
+def _write_all(fd, data):
+    """os.write() may write only part of the data, so keep going until done."""
+    while data:
+        written = os.write(fd, data)
+        data = data[written:]
+
+
+def _byte_writer(file):
+    """
+    Return (write_function, encoding) for writing raw bytes to file.
+
+    Real OS files (an io.FileIO, or a buffered writer around one) are written
+    with os.write() straight from the buffer. Every other object (compressed
+    files, BytesIO, custom writers) gets its own write() called with a copy,
+    since the buffer is reused for the next rows.
+    """
+    encoding = getattr(file, "encoding", None) or "utf-8"
+
+    if isinstance(file, io.TextIOBase):
+        if not hasattr(file, "buffer"):
+            # Text-only target such as io.StringIO
+            return (lambda data: file.write(str(data, encoding))), encoding
+        file.flush()
+        file = file.buffer
+
+    raw = file.raw if isinstance(file, io.BufferedWriter) else file
+    if not isinstance(raw, io.FileIO):
+        return (lambda data: file.write(bytes(data))), encoding
+
+    file.flush()
+    fd = raw.fileno()
+    return (lambda data: _write_all(fd, data)), encoding
+
+
+def write_pattern(height, char="*", file=None, buffer_size=BUFFER_SIZE):
+    """
+    Write the same pattern as print_pattern() to any file object, fast.
+
+    Every row is a prefix of one pre-encoded row of `height` characters,
+    so rows are copied straight into a single preallocated buffer and the
+    buffer is written out whenever it fills up. No row string is created.
+    """
+    file = sys.stdout if file is None else file
+    write, encoding = _byte_writer(file)
+
+    cell = char.encode(encoding)
+    widest_row = memoryview(cell * height)
+    newline = b"\n"[0]
+
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    position = 0
+
+    for i in row_lengths(height):
+        size = i * len(cell)
+
+        if position + size + 1 > buffer_size:
+            write(view[:position])
+            position = 0
+
+            if size + 1 > buffer_size:
+                # Row larger than the buffer: write it directly from the source
+                write(widest_row[:size])
+                write(b"\n")
+                continue
+
+        buffer[position:position + size] = widest_row[:size]
+        buffer[position + size] = newline
+        position += size + 1
+
+    if position:
+        write(view[:position])
+
+
 # Example usage:
-print_pattern(5, "*")
+if __name__ == "__main__":
+    print_pattern(5, "*")
@@ -0,0 +1,252 @@
+"""
+===========================================================
+Streaming Statistics
+-----------------------------------------------------------
+ File:    stream_stats.py
+ Version: 1.0
+ Date:    19/10/2026
+ Author:  Annelli
+
+ Description:
+     A constant-memory version of the average program in
+     while.py for number streams that may never end (for
+     example a sensor feed piped into stdin).
+
+     RunningStats keeps the count, mean, variance, minimum
+     and maximum without storing the numbers. Single values
+     are added with Welford's algorithm. Whole chunks are
+     summarised with exact integer sums and merged with the
+     parallel form of the same update (Chan et al.), which is
+     what makes reading piped files fast.
+
+     The rules from while.py still apply:
+         • zero is skipped
+         • -1 ends the input
+     Tokens that are not integers are skipped and counted.
+
+ Usage Example:
+     python stream_stats.py numbers.txt
+     some_sensor | python stream_stats.py --every 1000000
+===========================================================
+"""
+
+import argparse
+import codecs
+import math
+import operator
+import sys
+
+# Most bytes (or characters) taken from the stream per read
+READ_SIZE = 1 << 20
+
+STOP_VALUE = -1
+
+
+# ---------------------------------------------------------
+# Accumulator
+# ---------------------------------------------------------
+class RunningStats:
+    """
+    Running count, mean, variance, minimum and maximum in O(1) memory.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0           # sum of squared differences from the mean
+        self.minimum = None
+        self.maximum = None
+
+    def add(self, value):
+        """Add a single value (Welford's update)."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def add_many(self, values):
+        """
+        Add a list of integers at once.
+
+        The chunk's sum and sum of squares are exact Python integers, so
+        its own mean and m2 are exact before being merged in.
+        """
+        n = len(values)
+        if n == 0:
+            return
+
+        total = sum(values)
+        total_squares = sum(map(operator.mul, values, values))
+
+        self.merge(n, total / n, (total_squares * n - total * total) / n, min(values), max(values))
+
+    def merge(self, count, mean, m2, minimum, maximum):
+        """Merge the summary of another group of values into this one."""
+        if count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = count, mean, m2
+            self.minimum, self.maximum = minimum, maximum
+            return
+
+        combined = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / combined
+        self.m2 += m2 + delta * delta * self.count * count / combined
+        self.count = combined
+
+        self.minimum = min(self.minimum, minimum)
+        self.maximum = max(self.maximum, maximum)
+
+    @property
+    def variance(self):
+        """Sample variance (same definition as statistics.variance)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self):
+        """Sample standard deviation."""
+        return math.sqrt(self.variance)
+
+    def snapshot(self):
+        """Return a one-line summary of the current statistics."""
+        return (f"count={self.count} mean={self.mean:.6g} variance={self.variance:.6g} "
+                f"min={self.minimum} max={self.maximum}")
+
+
+# ---------------------------------------------------------
+# Stream reading
+# ---------------------------------------------------------
+def _read_blocks(stream):
+    """
+    Yield blocks of text from a stream as soon as any data is available,
+    so a slow feed that never ends is still processed as it arrives.
+    """
+    raw = getattr(stream, "buffer", stream)
+    if hasattr(raw, "read1"):
+        # A read1() returns what is already there instead of waiting for READ_SIZE bytes
+        decoder = codecs.getincrementaldecoder(getattr(stream, "encoding", None) or "utf-8")()
+        while data := raw.read1(READ_SIZE):
+            yield decoder.decode(data)
+        yield decoder.decode(b"", final=True)
+    else:
+        while block := stream.read(READ_SIZE):
+            yield block
+
+
+def _parse_tokens(tokens):
+    """
+    Convert tokens to ints up to the first -1.
+    Returns (values, number_of_invalid_tokens, stopped).
+    """
+    try:
+        values = list(map(int, tokens))
+    except ValueError:
+        pass
+    else:
+        if STOP_VALUE in values:
+            return values[:values.index(STOP_VALUE)], 0, True
+        return values, 0, False
+
+    # Slow path: at least one token is not an integer
+    values = []
+    invalid = 0
+    for token in tokens:
+        try:
+            value = int(token)
+        except ValueError:
+            invalid += 1
+            continue
+        if value == STOP_VALUE:
+            return values, invalid, True
+        values.append(value)
+    return values, invalid, False
+
+
+def stream_stats(stream, snapshot_every=0, on_snapshot=None, stats=None):
+    """
+    Read whitespace-separated integers from a text stream into a RunningStats.
+
+    Zeros are skipped and reading stops at -1 or at the end of the stream.
+    Data is handled as soon as it arrives, so snapshots and the -1 rule also
+    work on live input. If snapshot_every is set, on_snapshot(stats) is called
+    each time the count passes another multiple of it (checked once per read).
+
+    Returns (stats, number_of_invalid_tokens).
+    """
+    stats = stats or RunningStats()
+    on_snapshot = on_snapshot or (lambda s: print(s.snapshot(), flush=True))
+    next_snapshot = snapshot_every
+    invalid = 0
+    leftover = ""
+    blocks = _read_blocks(stream)
+
+    while True:
+        block = next(blocks, "")
+        at_end = not block
+
+        # A number may be split across two reads; keep the tail for later
+        text = leftover + block
+        if at_end:
+            leftover = ""
+        else:
+            text, leftover = _split_tail(text)
+
+        # -1 ends the input; tokens after it are ignored
+        values, bad, stopped = _parse_tokens(text.split())
+        invalid += bad
+
+        # Zero is explicitly not allowed
+        if 0 in values:
+            values = [v for v in values if v != 0]
+
+        stats.add_many(values)
+
+        if snapshot_every and stats.count >= next_snapshot:
+            on_snapshot(stats)
+            next_snapshot = (stats.count // snapshot_every + 1) * snapshot_every
+
+        if stopped or at_end:
+            return stats, invalid
+
+
+def _split_tail(text):
+    """Split text after its last whitespace character into (complete, incomplete)."""
+    cut = max(text.rfind(" "), text.rfind("\n"), text.rfind("\t"), text.rfind("\r")) + 1
+    return text[:cut], text[cut:]
+
+
+# ---------------------------------------------------------
+# Main Program
+# ---------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Constant-memory statistics for a stream of integers.")
+    parser.add_argument("file", nargs="?", help="file to read (default: stdin)")
+    parser.add_argument("--every", type=int, default=0, help="print a snapshot every N values")
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, "r") as stream:
+            stats, invalid = stream_stats(stream, args.every)
+    else:
+        stats, invalid = stream_stats(sys.stdin, args.every)
+
+    if invalid:
+        print(f"Skipped {invalid} tokens that were not integers.")
+
+    if stats.count:
+        print(f"\nThe average of the numbers entered is: {stats.mean}")
+        print(stats.snapshot())
+    else:
+        print("\nNo valid numbers were entered.")
+
+
+if __name__ == "__main__":
+    main()
+
+# ============== END OF CODE ==============
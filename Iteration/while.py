@@ -1,4 +1,4 @@
-import statistics
+from stream_stats import RunningStats
 
 def get_int(prompt):
     """
@@ -15,7 +15,7 @@ def get_int(prompt):
 # Main program loop (restarts if user enters no valid numbers)
 while True:
     
-    nums = []  # Stores all valid non-zero integers entered by the user
+    stats = RunningStats()  # Running statistics of the valid non-zero integers (O(1) memory)
 
     # Inner loop: collect numbers until user enters -1
     while (n := get_int("Enter any integer number (-1 to exit): \n")) != -1:
@@ -25,13 +25,13 @@ while True:
             print("Zero is not allowed. Try again.\n")
             continue
 
-        # Valid number → store it
-        nums.append(n)
+        # Valid number → add it to the running statistics
+        stats.add(n)
 
     # After exiting inner loop, check if we have valid numbers
-    if nums:
+    if stats.count:
         # Calculate and display the average
-        print(f"\nThe average of the numbers you entered is: {statistics.mean(nums)}")
+        print(f"\nThe average of the numbers you entered is: {stats.mean}")
         break  # End program
 
     # If no valid numbers were entered, restart the outer loop
@@ -3,20 +3,28 @@
 Recursive Maximum Finder
 -----------------------------------------------------------
  File:    largest_number.py
- Version: 1.0
+ Version: 1.1
  Date:    22/12/2025
  Author:  Annelli
 
  Description:
      This program defines a recursive function that determines
      the largest number in a list without using loops or the
-     built-in max() function. The algorithm works by comparing
-     the first element of the list with the largest element in
-     the remainder of the list, reducing the problem size on
-     each recursive call.
-
-     The recursion terminates when the list contains only one
-     element, which is returned as the base case.
+     built-in max() function. The algorithm uses divide and
+     conquer: the index range is split in half, the largest
+     number of each half is found recursively, and the two
+     results are compared.
+
+     The recursion terminates when the range contains only one
+     element, which is returned as the base case. Because the
+     range halves on each call, the recursion depth is only
+     about log2(n), and because the function works on index
+     ranges no part of the list is ever copied.
+
+     For very large lists, largest_number_parallel() splits the
+     list into chunks, finds the largest number of each chunk
+     in a process pool and combines the results with the same
+     recursion.
 
  Requirements:
      • Python 3.x
@@ -29,8 +37,13 @@ Recursive Maximum Finder
 
  Notes:
      • Includes input validation to ensure safe execution.
-     • Optional tracing output is included to visualise the
-       recursive call sequence.
+     • Input is validated once, at the public entry point.
+     • Optional tracing output can be enabled through the
+       "recursion" logger to visualise the recursive call
+       sequence. It is off by default.
+     • largest_number_parallel() needs this module to be
+       imported by its name ("largest_number"), because the
+       worker processes look the chunk function up by name.
      • This function is intended for educational purposes to
        illustrate recursion.
 ===========================================================
@@ -39,33 +52,51 @@ Recursive Maximum Finder
 # =========================================================
 # PSEUDOCODE
 # =========================================================
-# function largest_number(list):
-#     if list has length 1:
-#         return list[0]
-#    else:
-#         largest_rest = largest_number(list[1:])
-#        
-#         if list[0] > largest_rest:
-#             return list[0]
+# function largest_in_range(list, low, high):
+#     if high - low == 1:
+#         return list[low]
+#     else:
+#         middle = (low + high) // 2
+#         largest_left = largest_in_range(list, low, middle)
+#         largest_right = largest_in_range(list, middle, high)
+#
+#         if largest_left > largest_right:
+#             return largest_left
 #         else:
-#             return largest_rest
+#             return largest_right
+#
+# function largest_number(list):
+#     return largest_in_range(list, 0, length of list)
 
 # =========================================================
 # PYTHON CODE
 # =========================================================
 
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
 # ---------------------------------------------------------
-# Recursive function including input validation and print-tracing
+# Tracing hook
 # ---------------------------------------------------------
+# Tracing goes through the shared "recursion" logger and is off by default.
+# Enable it for every recursive helper with:
+#     logging.basicConfig(format="%(message)s")
+#     logging.getLogger("recursion").setLevel(logging.DEBUG)
+logger = logging.getLogger("recursion.largest_number")
 
-def largest_number(numbers_list):
+# Lists shorter than this are not worth sending to a process pool
+PARALLEL_THRESHOLD = 1_000_000
+
+
+# ---------------------------------------------------------
+# Input validation (shared by both entry points)
+# ---------------------------------------------------------
+def _validate(numbers_list):
     """
-    Recursively finds the largest number in a list.
+    Raise TypeError/ValueError if numbers_list is not a non-empty list of numbers.
     """
-
-    # -----------------------------
-    # Input validation
-    # -----------------------------
     if not isinstance(numbers_list, list):
         raise TypeError("Input must be a list.")
 
@@ -75,32 +106,123 @@ def largest_number(numbers_list):
     if not all(isinstance(x, (int, float)) for x in numbers_list):
         raise ValueError("All elements in the list must be numbers.")
 
+
+# ---------------------------------------------------------
+# Public entry point: validates once, then recurses
+# ---------------------------------------------------------
+def largest_number(numbers_list):
+    """
+    Recursively finds the largest number in a list.
+    """
+    _validate(numbers_list)
+
+    # The logger level is checked once here, not at every recursive step
+    return _largest_in_range(numbers_list, 0, len(numbers_list), logger.isEnabledFor(logging.DEBUG))
+
+
+def largest_number_parallel(numbers_list, workers=None, chunk_size=None):
+    """
+    Find the largest number in a list using a process pool.
+
+    The list is split into chunks, each worker finds the largest number
+    of its chunks recursively, and the partial results are combined with
+    the same recursion. Lists shorter than PARALLEL_THRESHOLD are handled
+    in-process by largest_number().
+
+    workers defaults to the number of CPUs; workers and chunk_size must be
+    positive integers when given. Worker processes import this module by
+    name, so it must be imported as "largest_number" (or run as a script);
+    RuntimeError is raised when it was loaded from a file path under
+    another name or without being registered in sys.modules.
+    """
+    _validate(numbers_list)
+
+    for name, value in (("workers", workers), ("chunk_size", chunk_size)):
+        if value is not None and (not isinstance(value, int) or value < 1):
+            raise ValueError(f"{name} must be a positive integer.")
+
+    if len(numbers_list) < PARALLEL_THRESHOLD:
+        return _largest_in_range(numbers_list, 0, len(numbers_list), logger.isEnabledFor(logging.DEBUG))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = -(-len(numbers_list) // (workers * 4))  # ceiling division
+
+    chunks = [numbers_list[i:i + chunk_size] for i in range(0, len(numbers_list), chunk_size)]
+
+    _check_importable()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        partial_results = list(pool.map(_largest_of_chunk, chunks))
+
+    return _largest_in_range(partial_results, 0, len(partial_results), False)
+
+
+# ---------------------------------------------------------
+# Recursive helpers (inputs already validated)
+# ---------------------------------------------------------
+def _largest_in_range(numbers_list, low, high, trace):
+    """
+    Return the largest number in numbers_list[low:high] without copying the list.
+    """
+
     # -----------------------------
     # Recursion tracing
     # -----------------------------
-    print(f"Calling largest_number on: {numbers_list}")
+    if trace:
+        logger.debug("Calling largest_number on: %s", numbers_list[low:high])
 
     # -----------------------------
     # Base case
     # -----------------------------
-    if len(numbers_list) == 1:
-        print(f"Base case reached: returning {numbers_list[0]}")
-        return numbers_list[0]
+    if high - low == 1:
+        if trace:
+            logger.debug("Base case reached: returning %s", numbers_list[low])
+        return numbers_list[low]
 
     # -----------------------------
     # Recursive case
     # -----------------------------
-    largest_rest = largest_number(numbers_list[1:])
-
-    # Compare first element with the largest of the rest
-    if numbers_list[0] > largest_rest:
-        print(f"Comparing {numbers_list[0]} with {largest_rest} → keeping {numbers_list[0]}")
-        return numbers_list[0]
+    middle = (low + high) // 2
+    largest_left = _largest_in_range(numbers_list, low, middle, trace)
+    largest_right = _largest_in_range(numbers_list, middle, high, trace)
+
+    # Compare the largest of each half
+    if largest_left > largest_right:
+        if trace:
+            logger.debug("Comparing %s with %s → keeping %s", largest_left, largest_right, largest_left)
+        return largest_left
     else:
-        print(f"Comparing {numbers_list[0]} with {largest_rest} → keeping {largest_rest}")
-        return largest_rest
+        if trace:
+            logger.debug("Comparing %s with %s → keeping %s", largest_left, largest_right, largest_right)
+        return largest_right
 
-# Example test
-print("Largest number in", [5, 6, 18, 24, 2, 30, 16, 58], ":", largest_number([5, 6, 18, 24, 2, 30, 16, 58]))
+
+def _largest_of_chunk(chunk):
+    """Worker task for largest_number_parallel()."""
+    return _largest_in_range(chunk, 0, len(chunk), False)
+
+
+def _check_importable():
+    """
+    Worker processes look _largest_of_chunk up by module name, so this
+    module must be imported under its real name (or run as a script).
+    """
+    module_name = os.path.splitext(os.path.basename(__file__))[0]
+    if __name__ == "__main__" or (__name__ == module_name and
+                                  getattr(sys.modules.get(__name__), "_largest_of_chunk", None)
+                                  is _largest_of_chunk):
+        return
+
+    raise RuntimeError(f"largest_number_parallel() needs this module to be importable as "
+                       f"'{module_name}': add its folder to sys.path and import it by name "
+                       f"instead of loading it from a file path.")
+
+
+# Example test (with tracing switched on)
+if __name__ == "__main__":
+    logging.basicConfig(format="%(message)s")
+    logging.getLogger("recursion").setLevel(logging.DEBUG)
+    print("Largest number in", [5, 6, 18, 24, 2, 30, 16, 58], ":", largest_number([5, 6, 18, 24, 2, 30, 16, 58]))
 
 # ============== END OF CODE ==============
@@ -30,8 +30,10 @@ Recursive Summation
 
  Notes:
      • Includes input validation to ensure safe execution.
-     • Optional tracing output can be enabled to visualise
-       the recursive call sequence.
+     • Input is validated once, at the public entry point.
+     • Optional tracing output can be enabled through the
+       "recursion" logger to visualise the recursive call
+       sequence. It is off by default.
      • This function is intended for educational purposes to
        illustrate recursion, not for performance‑critical use.
 ===========================================================
@@ -54,8 +56,20 @@ Recursive Summation
 # PYTHON CODE
 # =========================================================
 
+import logging
+
+# ---------------------------------------------------------
+# Tracing hook
+# ---------------------------------------------------------
+# Tracing goes through the shared "recursion" logger and is off by default.
+# Enable it for every recursive helper with:
+#     logging.basicConfig(format="%(message)s")
+#     logging.getLogger("recursion").setLevel(logging.DEBUG)
+logger = logging.getLogger("recursion.sum_recursion")
+
+
 # ---------------------------------------------------------
-# Recursive function including input validation and print-tracing
+# Public entry point: validates once, then recurses
 # ---------------------------------------------------------
 def adding_up_to(numbers_list, index):
     """
@@ -80,27 +94,45 @@ def adding_up_to(numbers_list, index):
     if index >= len(numbers_list):
         raise IndexError("index is out of range for the list.")
 
+    # The logger level is checked once here, not at every recursive step
+    return _adding_up_to(numbers_list, index, logger.isEnabledFor(logging.DEBUG))
+
+
+# ---------------------------------------------------------
+# Recursive helper (inputs already validated)
+# ---------------------------------------------------------
+def _adding_up_to(numbers_list, index, trace):
+    """
+    Recursive step of adding_up_to(). Assumes validated input.
+    """
+
     # -----------------------------
     # Recursion tracing
     # -----------------------------
-    print(f"Calling adding_up_to with index = {index}")
+    if trace:
+        logger.debug("Calling adding_up_to with index = %s", index)
 
     # -----------------------------
     # Base case
     # -----------------------------
     if index == 0:
-        print(f"Base case reached: returning {numbers_list[0]}")
+        if trace:
+            logger.debug("Base case reached: returning %s", numbers_list[0])
         return numbers_list[0]
 
     # -----------------------------
     # Recursive case
     # -----------------------------
-    result = numbers_list[index] + adding_up_to(numbers_list, index - 1)
-    print(f"Returning {numbers_list[index]} + sum_up_to({index - 1}) = {result}")
+    result = numbers_list[index] + _adding_up_to(numbers_list, index - 1, trace)
+    if trace:
+        logger.debug("Returning %s + sum_up_to(%s) = %s", numbers_list[index], index - 1, result)
     return result
 
 
-# Example test
-print("\nFinal result:", adding_up_to([1, 3, 6, 2, 14, 26], 5))
+# Example test (with tracing switched on)
+if __name__ == "__main__":
+    logging.basicConfig(format="%(message)s")
+    logging.getLogger("recursion").setLevel(logging.DEBUG)
+    print("\nFinal result:", adding_up_to([1, 3, 6, 2, 14, 26], 5))
 
 # ============= END OF CODE =============
@@ -0,0 +1,110 @@
+"""
+===========================================================
+Tree Reduction Benchmark
+-----------------------------------------------------------
+ File:    benchmark_reduction.py
+ Version: 1.0
+ Date:    19/10/2026
+ Author:  Annelli
+
+ Description:
+     Compares the reduction backends in reduction.py on
+     inputs of 10^3 up to 10^9 elements.
+
+     The pure Python backends ("sequential", "thread",
+     "process") work on lists and are only run up to
+     --python-max-exp, because a list of 10^9 floats does not
+     fit in memory. The "numpy" backend works on float64
+     arrays; from 10^8 elements upwards the data is written to
+     a temporary file and reduced through a memory map.
+
+ Usage Example:
+     python benchmark_reduction.py
+     python benchmark_reduction.py --op max --max-exp 9
+===========================================================
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from reduction import BACKENDS, OPERATORS, np, reduce
+
+# Inputs at least this large are benchmarked from a memory-mapped file
+MEMMAP_THRESHOLD = 10 ** 8
+
+
+# ---------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------
+def make_array(size, directory):
+    """Return a float64 array of the given size, memory-mapped if it is large."""
+    if size < MEMMAP_THRESHOLD:
+        return np.random.default_rng(0).random(size)
+
+    path = os.path.join(directory, f"reduce_{size}.f64")
+    data = np.memmap(path, dtype="float64", mode="w+", shape=(size,))
+    rng = np.random.default_rng(0)
+    step = 10 ** 7
+    for low in range(0, size, step):
+        high = min(low + step, size)
+        data[low:high] = rng.random(high - low)
+    data.flush()
+    return np.memmap(path, dtype="float64", mode="r")
+
+
+def time_call(func, *args, **kwargs):
+    """Return the wall-clock time of a single call in seconds."""
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+# ---------------------------------------------------------
+# Main Program
+# ---------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the tree reduction backends.")
+    parser.add_argument("--op", default="sum", choices=sorted(OPERATORS))
+    parser.add_argument("--min-exp", type=int, default=3)
+    parser.add_argument("--max-exp", type=int, default=7, help="largest size is 10^max-exp (up to 9)")
+    parser.add_argument("--python-max-exp", type=int, default=6,
+                        help="largest size for the pure Python backends")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    if np is None:
+        raise SystemExit("This benchmark needs NumPy to generate its input data.")
+
+    print(f"Operator: {args.op}   (times in seconds, elements per second in brackets)\n")
+    print(f"{'Size':>14}" + "".join(f"{backend:>24}" for backend in BACKENDS))
+    print("-" * (14 + 24 * len(BACKENDS)))
+
+    with tempfile.TemporaryDirectory() as directory:
+        for exponent in range(args.min_exp, args.max_exp + 1):
+            size = 10 ** exponent
+            array = make_array(size, directory)
+            as_list = array.tolist() if exponent <= args.python_max_exp else None
+
+            cells = []
+            for backend in BACKENDS:
+                if backend == "numpy":
+                    data = array
+                elif as_list is not None:
+                    data = as_list
+                else:
+                    cells.append(f"{'-':>24}")
+                    continue
+
+                elapsed = time_call(reduce, data, args.op, backend=backend, workers=args.workers)
+                cells.append(f"{elapsed:>11.4f} ({size / elapsed:>9.2e})")
+
+            print(f"{size:>14,}" + "".join(cells))
+            del array, as_list
+
+
+if __name__ == "__main__":
+    main()
+
+# ============== END OF CODE ==============
@@ -0,0 +1,269 @@
+"""
+===========================================================
+Tree Reduction
+-----------------------------------------------------------
+ File:    reduction.py
+ Version: 1.0
+ Date:    19/10/2026
+ Author:  Annelli
+
+ Description:
+     adding_up_to() and largest_number() are both examples of
+     "reducing" a list to a single value with a binary
+     operator (+ and the larger-of-two comparison). This module
+     generalises that idea to any associative operator and
+     runs it as a tree reduction: the index range is split in
+     half, each half is reduced recursively, and the two
+     results are combined. The recursion depth is about
+     log2(n) and no part of the input is copied.
+
+     Several backends are available:
+         • "sequential" – pure Python tree reduction
+         • "numpy"      – chunked NumPy ufunc reduction
+         • "thread"     – chunks reduced in a thread pool
+         • "process"    – chunks reduced in a process pool
+
+     reduce_stream() reduces an iterator chunk by chunk in
+     constant memory, and reduce_file() reduces a binary file
+     of numbers through a NumPy memory map.
+
+ Requirements:
+     • Python 3.x
+     • NumPy (optional – only for the "numpy" backend and
+       reduce_file())
+
+ Usage Example:
+     reduce([3, 1, 6, 8, 2], "max")                # 8
+     reduce(range(1, 6), "product")                 # 120
+     reduce(big_array, "sum", backend="numpy")
+     reduce_stream(open("numbers.txt"), "sum", convert=float)
+
+ Notes:
+     • The operator must be associative, otherwise the result
+       depends on how the range is split.
+     • Custom operators for the "process" backend must be
+       defined at module level so they can be pickled.
+===========================================================
+"""
+
+# =========================================================
+# PSEUDOCODE
+# =========================================================
+# function tree_reduce(list, op, low, high):
+#     if high - low == 1:
+#         return list[low]
+#     else:
+#         middle = (low + high) // 2
+#         return op(tree_reduce(list, op, low, middle),
+#                   tree_reduce(list, op, middle, high))
+
+# =========================================================
+# PYTHON CODE
+# =========================================================
+
+import functools
+import itertools
+import operator
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+# Ranges this short are folded left to right instead of split further
+LEAF_SIZE = 32
+
+# Default number of elements handled per chunk / per worker task
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+BACKENDS = ("sequential", "numpy", "thread", "process")
+
+
+# ---------------------------------------------------------
+# Built-in operators
+# ---------------------------------------------------------
+def larger(a, b):
+    """Return the larger of a and b (the later value on ties)."""
+    return a if a > b else b
+
+
+def smaller(a, b):
+    """Return the smaller of a and b (the later value on ties)."""
+    return a if a < b else b
+
+
+# name -> (Python binary function, name of the matching NumPy ufunc)
+OPERATORS = {
+    "sum": (operator.add, "add"),
+    "product": (operator.mul, "multiply"),
+    "max": (larger, "maximum"),
+    "min": (smaller, "minimum"),
+}
+
+
+def _resolve_operator(op):
+    """
+    Return (binary_function, ufunc_or_None) for an operator name,
+    a NumPy ufunc or any two-argument callable.
+    """
+    if isinstance(op, str):
+        if op not in OPERATORS:
+            raise ValueError(f"Unknown operator '{op}'. Choose one of {sorted(OPERATORS)}.")
+        func, ufunc_name = OPERATORS[op]
+        return func, getattr(np, ufunc_name) if np is not None else None
+
+    if np is not None and isinstance(op, np.ufunc):
+        return op, op
+
+    if not callable(op):
+        raise TypeError("op must be an operator name or a two-argument callable.")
+
+    return op, None
+
+
+# ---------------------------------------------------------
+# Core recursion
+# ---------------------------------------------------------
+def tree_reduce(values, op, low=0, high=None):
+    """
+    Reduce values[low:high] with the binary function op as a balanced tree.
+    """
+    if high is None:
+        high = len(values)
+
+    if high - low <= LEAF_SIZE:
+        # Base case: fold a short range directly
+        return functools.reduce(op, values[low:high])
+
+    middle = (low + high) // 2
+    return op(tree_reduce(values, op, low, middle), tree_reduce(values, op, middle, high))
+
+
+def _reduce_chunk(values, func, ufunc):
+    """Reduce one chunk, using the ufunc when the chunk is a NumPy array."""
+    if ufunc is not None and np is not None and isinstance(values, np.ndarray):
+        return ufunc.reduce(values)
+    return tree_reduce(values, func)
+
+
+def _chunk_bounds(length, chunk_size):
+    """Return (low, high) index pairs covering range(length)."""
+    return [(low, min(low + chunk_size, length)) for low in range(0, length, chunk_size)]
+
+
+# ---------------------------------------------------------
+# Public API
+# ---------------------------------------------------------
+def reduce(values, op="sum", backend="sequential", workers=None, chunk_size=None):
+    """
+    Reduce a sequence to a single value with an associative operator.
+
+    values may be a list, tuple, range, NumPy array or memory map.
+    op is "sum", "product", "max", "min", a NumPy ufunc or any
+    associative two-argument callable.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}'. Choose one of {BACKENDS}.")
+
+    if len(values) == 0:
+        raise ValueError("Cannot reduce an empty sequence.")
+
+    func, ufunc = _resolve_operator(op)
+    chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+
+    # -----------------------------
+    # Sequential
+    # -----------------------------
+    if backend == "sequential":
+        return tree_reduce(values, func)
+
+    # -----------------------------
+    # Chunked NumPy
+    # -----------------------------
+    if backend == "numpy":
+        if np is None:
+            raise ImportError("The 'numpy' backend requires NumPy to be installed.")
+        if ufunc is None:
+            raise ValueError("The 'numpy' backend needs an operator name or a NumPy ufunc.")
+
+        array = values if isinstance(values, np.ndarray) else np.asarray(values)
+        # Chunking keeps memory-mapped input from being faulted in all at once
+        partials = [ufunc.reduce(array[low:high]) for low, high in _chunk_bounds(len(array), chunk_size)]
+        return tree_reduce(partials, func)
+
+    # -----------------------------
+    # Thread / process pools
+    # -----------------------------
+    workers = workers or os.cpu_count() or 1
+    bounds = _chunk_bounds(len(values), chunk_size)
+
+    if backend == "thread":
+        # Threads share memory, so each task reduces an index range in place
+        use_ufunc = ufunc is not None and np is not None and isinstance(values, np.ndarray)
+
+        def reduce_range(bound):
+            low, high = bound
+            if use_ufunc:
+                return ufunc.reduce(values[low:high])  # array slices are views
+            return tree_reduce(values, func, low, high)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            partials = list(pool.map(reduce_range, bounds))
+    else:
+        # Processes need their own copy of each chunk
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = (values[low:high] for low, high in bounds)
+            partials = list(pool.map(_reduce_chunk, chunks, itertools.repeat(func), itertools.repeat(ufunc)))
+
+    return tree_reduce(partials, func)
+
+
+def reduce_stream(iterable, op="sum", chunk_size=None, convert=None, backend="sequential"):
+    """
+    Reduce an iterator in constant memory.
+
+    Items are read chunk_size at a time, each chunk is reduced with the
+    chosen backend ("sequential" or "numpy"), and the chunk results are
+    folded into a running total. convert (e.g. float) is applied to each
+    item first, which allows reading numbers straight from a text file.
+    """
+    if backend not in ("sequential", "numpy"):
+        raise ValueError("reduce_stream() supports the 'sequential' and 'numpy' backends.")
+
+    func, _ = _resolve_operator(op)
+    chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+    iterator = iter(iterable) if convert is None else map(convert, iterable)
+
+    result = None
+    have_result = False
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        partial = reduce(chunk, op, backend=backend, chunk_size=chunk_size)
+        result = func(result, partial) if have_result else partial
+        have_result = True
+
+    if not have_result:
+        raise ValueError("Cannot reduce an empty sequence.")
+
+    return result
+
+
+def reduce_file(path, op="sum", dtype="float64", backend="numpy", workers=None, chunk_size=None):
+    """
+    Reduce a raw binary file of numbers through a read-only memory map.
+    """
+    if np is None:
+        raise ImportError("reduce_file() requires NumPy to be installed.")
+
+    data = np.memmap(path, dtype=dtype, mode="r")
+    return reduce(data, op, backend=backend, workers=workers, chunk_size=chunk_size)
+
+
+# Example usage
+if __name__ == "__main__":
+    numbers = [5, 6, 18, 24, 2, 30, 16, 58]
+    for name in OPERATORS:
+        print(f"{name:<8}", reduce(numbers, name))
+
+# ============== END OF CODE ==============
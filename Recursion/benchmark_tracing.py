@@ -0,0 +1,96 @@
+"""
+===========================================================
+Recursion Tracing Benchmark
+-----------------------------------------------------------
+ File:    benchmark_tracing.py
+ Version: 1.0
+ Date:    19/10/2026
+ Author:  Annelli
+
+ Description:
+     Measures the throughput of adding_up_to() and
+     largest_number() with tracing switched off (the default)
+     and switched on. Traced output is sent to os.devnull so
+     the numbers show the cost of the tracing itself rather
+     than the speed of the terminal.
+
+ Usage Example:
+     python benchmark_tracing.py
+     python benchmark_tracing.py --size 500 --repeat 200
+===========================================================
+"""
+
+import argparse
+import importlib.util
+import logging
+import os
+import random
+import time
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+# ---------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------
+def load_module(name, relative_path):
+    """Load a module from a file path (the project folders contain spaces)."""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(script_dir, relative_path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def calls_per_second(func, args, repeat):
+    """Call func(*args) repeat times and return calls per second."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(*args)
+    elapsed = time.perf_counter() - start
+    return repeat / elapsed
+
+
+# ---------------------------------------------------------
+# Main Program
+# ---------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark traced vs untraced recursion.")
+    parser.add_argument("--size", type=int, default=200, help="list length (keep below the recursion limit)")
+    parser.add_argument("--repeat", type=int, default=100, help="calls per measurement")
+    args = parser.parse_args()
+
+    sum_recursion = load_module("sum_recursion", os.path.join("Recursive Summation", "sum_recursion.py"))
+    largest = load_module("largest_number", os.path.join("Recursive Maximum Finder", "largest_number.py"))
+
+    numbers = [random.randint(-1000, 1000) for _ in range(args.size)]
+    cases = [
+        ("adding_up_to", sum_recursion.adding_up_to, (numbers, len(numbers) - 1)),
+        ("largest_number", largest.largest_number, (numbers,)),
+    ]
+
+    recursion_logger = logging.getLogger("recursion")
+    recursion_logger.propagate = False
+
+    with open(os.devnull, "w") as devnull:
+        handler = logging.StreamHandler(devnull)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        recursion_logger.addHandler(handler)
+
+        print(f"{'Function':<18}{'Untraced (calls/s)':>20}{'Traced (calls/s)':>20}{'Speed-up':>10}")
+        print("-" * 68)
+        for name, func, call_args in cases:
+            recursion_logger.setLevel(logging.WARNING)
+            untraced = calls_per_second(func, call_args, args.repeat)
+
+            recursion_logger.setLevel(logging.DEBUG)
+            traced = calls_per_second(func, call_args, args.repeat)
+
+            print(f"{name:<18}{untraced:>20,.0f}{traced:>20,.0f}{untraced / traced:>9.1f}x")
+
+        recursion_logger.removeHandler(handler)
+
+
+if __name__ == "__main__":
+    main()
+
+# ============= END OF CODE =============
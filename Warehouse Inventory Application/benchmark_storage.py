@@ -0,0 +1,135 @@
+"""
+===========================================================
+ INVENTORY STORAGE BENCHMARK
+-----------------------------------------------------------
+ File:    benchmark_storage.py
+ Version: 1.0
+ Date:    19/10/2026
+ Author:  Annelli
+
+ Description:
+     Compares the CSV and SQLite storage backends on
+     generated inventories of 10^4 up to 10^7 rows. For each
+     size it times opening/loading the inventory, a search
+     for the last code, the lowest and highest stock items,
+     the total stock value and a single quantity update.
+
+     The CSV backend is measured twice: "csv" parses the
+     text file (and builds the binary snapshot), "csv+snap"
+     starts from a snapshot. The update at the end of the
+     "csv" run removes the snapshot, so it is rebuilt
+     (untimed) before the "csv+snap" run.
+
+ Usage Example:
+     python benchmark_storage.py
+     python benchmark_storage.py --max-exp 7
+===========================================================
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from inventory import Shoe
+from inventory_convert import csv_to_sqlite
+from inventory_snapshot import snapshot_path
+from inventory_storage import CsvStorage, SqliteStorage, write_csv_rows
+
+
+# ---------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------
+def generate_rows(count, seed=2026):
+    """Yield `count` random inventory rows with unique codes."""
+    rng = random.Random(seed)
+    for i in range(count):
+        yield (f"Country {i % 50}", f"SKU{i:08d}", f"Product {i % 500}",
+               rng.randint(100, 5000), rng.randint(0, 10_000))
+
+
+def timed(func, *args):
+    """Return (result, seconds) of func(*args)."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def run_operations(storage, last_code):
+    """Time each query on an open, loaded storage. Returns {operation: seconds}."""
+    times = {}
+    _, times["find"] = timed(storage.find, last_code)
+    lowest, times["lowest"] = timed(storage.lowest)
+    _, times["highest"] = timed(storage.highest)
+    _, times["total_value"] = timed(storage.total_value)
+
+    lowest.quantity += 1
+    _, times["update"] = timed(storage.update_quantity, lowest)
+    return times
+
+
+def open_csv(path):
+    storage = CsvStorage(path, Shoe)
+    storage.load()
+    return storage
+
+
+def open_sqlite(path):
+    storage = SqliteStorage(path, Shoe)
+    storage.load()
+    return storage
+
+
+def build_snapshot(path):
+    """Load the CSV file once so the next load starts from a fresh snapshot."""
+    open_csv(path).close()
+    if not os.path.exists(snapshot_path(path)):
+        raise RuntimeError("The snapshot was not built (is INVENTORY_SNAPSHOT=0 set?).")
+
+
+# ---------------------------------------------------------
+# Main Program
+# ---------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the inventory storage backends.")
+    parser.add_argument("--min-exp", type=int, default=4)
+    parser.add_argument("--max-exp", type=int, default=6, help="largest size is 10^max-exp (up to 7)")
+    args = parser.parse_args()
+
+    operations = ["open", "find", "lowest", "highest", "total_value", "update"]
+    print("Times in milliseconds\n")
+    print(f"{'Rows':>12}{'Backend':>10}" + "".join(f"{op:>13}" for op in operations))
+    print("-" * (22 + 13 * len(operations)))
+
+    with tempfile.TemporaryDirectory() as directory:
+        for exponent in range(args.min_exp, args.max_exp + 1):
+            size = 10 ** exponent
+            csv_path = os.path.join(directory, f"inventory_{size}.txt")
+            db_path = os.path.join(directory, f"inventory_{size}.db")
+
+            write_csv_rows(csv_path, generate_rows(size))
+            _, import_seconds = timed(csv_to_sqlite, csv_path, db_path)
+            last_code = f"SKU{size - 1:08d}"
+
+            backends = (("csv", open_csv, csv_path, None),
+                        ("csv+snap", open_csv, csv_path, build_snapshot),
+                        ("sqlite", open_sqlite, db_path, None))
+            for name, opener, path, prepare in backends:
+                if prepare is not None:
+                    prepare(path)
+
+                storage, open_seconds = timed(opener, path)
+                times = {"open": open_seconds, **run_operations(storage, last_code)}
+                storage.close()
+                del storage
+
+                print(f"{size:>12,}{name:>10}" + "".join(f"{times[op] * 1000:>13.3f}" for op in operations))
+
+            print(f"{'':>12}{'(CSV -> SQLite import took ' + format(import_seconds, '.2f') + ' s)':>41}")
+
+
+if __name__ == "__main__":
+    main()
+
+# --------------------- End of Code -----------------------
@@ -22,6 +22,13 @@
      The program demonstrates object‑oriented programming,
      file handling, defensive coding, and modular design.
 
+     Optional metrics and profiling are provided by
+     inventory_metrics.py (see that file for the settings).
+
+     Shoes are stored in inventory.txt by default. Set
+     INVENTORY_BACKEND=sqlite to use an indexed SQLite
+     database (inventory.db) instead - see inventory_storage.py.
+
 Notes: 
     This program is intended for educational purposes to
     illustrate recursion, not for performance‑critical use.
@@ -32,9 +39,15 @@ from dataclasses import dataclass
 from tabulate import tabulate
 import os
 
+import inventory_metrics as metrics
+import inventory_storage
+
 script_dir = os.path.dirname(os.path.abspath(__file__))
 file_path = os.path.join(script_dir, "inventory.txt")
 
+# Storage backend: "csv" (inventory.txt, the default) or "sqlite" (inventory.db)
+BACKEND = os.environ.get("INVENTORY_BACKEND", "csv")
+
 
 # ---------------------------------------------------------
 # The beginning of the class
@@ -65,33 +78,36 @@ class Shoe:
 # ---------------------------------------------------------
 # Shoe list
 # ---------------------------------------------------------
-# This list stores all Shoe objects created from the inventory file.
+# This list stores all Shoe objects created from the inventory file
+# (CSV backend only - the SQLite backend keeps them in the database).
 shoe_list = []
 
+# The storage backend, opened by read_shoes_data()
+storage = None
+
 
 # ---------------------------------------------------------
 # Functions outside the class
 # ---------------------------------------------------------
-def read_shoes_data():
+@metrics.timed("render_table")
+def render_table(rows, **kwargs):
     """
-    Read shoe data from inventory.txt and populate shoe_list.
-    Uses try/except for defensive error handling.
+    Format rows with tabulate using the program's table style.
     """
-    try:
-        with open(file_path, "r") as file:
-            next(file)  # Skip header line
-
-            for line in file:
-                if line.strip() == "":
-                    continue  # Skip empty lines
+    return tabulate(rows, tablefmt="fancy_grid", **kwargs)
 
-                # Split CSV line into components
-                country, code, product, cost, quantity = line.strip().split(",")
 
-                # Create Shoe object and store it
-                shoe = Shoe(country, code, product, int(cost), int(quantity))
-                shoe_list.append(shoe)
+@metrics.timed("read_shoes_data")
+def read_shoes_data():
+    """
+    Open the storage backend and load the shoe data (into shoe_list
+    for the CSV backend). Uses try/except for defensive error handling.
+    """
+    global storage
+    storage = inventory_storage.open_storage(BACKEND, file_path, Shoe, shoe_list)
 
+    try:
+        storage.load()
         print("Inventory loaded successfully.")
 
     except FileNotFoundError:
@@ -103,7 +119,7 @@ def read_shoes_data():
 def capture_shoes():
     """
     Allow the user to manually enter a new shoe item.
-    Creates a Shoe object and appends it to shoe_list.
+    Creates a Shoe object and adds it to the inventory.
     """
     try:
         country = input("Enter country: ")
@@ -113,9 +129,7 @@ def capture_shoes():
         quantity = int(input("Enter quantity: "))
 
         new_shoe = Shoe(country, code, product, cost, quantity)
-        shoe_list.append(new_shoe)
-
-        update_inventory_file()
+        storage.add(new_shoe)
 
         print("Shoe added successfully.")
 
@@ -125,31 +139,31 @@ def capture_shoes():
 
 def view_all():
     """
-    Display all shoes in the shoe_list in a formatted table.
+    Display all shoes in the inventory in a formatted table.
     """
-    if not shoe_list:
+    shoes = storage.all()
+    if not shoes:
         print("No shoes loaded.")
         return
 
     print("\n===== ALL SHOES =====")
-    print(tabulate(shoe_list, headers="keys", tablefmt="fancy_grid"))
+    print(render_table(shoes, headers="keys"))
     print()
 
 
 def re_stock():
     """
     Find the shoe with the lowest quantity and offer to restock it.
-    Updates the inventory file after restocking.
+    Updates the inventory after restocking.
     """
-    if not shoe_list:
+    # Find shoe with lowest quantity
+    lowest = storage.lowest()
+    if lowest is None:
         print("No shoes loaded.")
         return
 
-    # Find shoe with lowest quantity
-    lowest = min(shoe_list, key=lambda s: s.quantity)
-
     print("\n===== LOWEST STOCK ITEM =====")
-    print(tabulate([lowest], headers="keys", tablefmt="fancy_grid"))
+    print(render_table([lowest], headers="keys"))
     print()
 
     # Ask user if they want to restock
@@ -160,25 +174,33 @@ def re_stock():
             add_qty = int(input("Enter quantity to add: "))
             lowest.quantity += add_qty
 
-            update_inventory_file()
+            storage.update_quantity(lowest)
             print("Stock updated successfully.")
 
         except ValueError:
             print("Invalid quantity entered.")
 
 
+@metrics.timed("find_shoe")
+def find_shoe(code):
+    """
+    Return the shoe with the given code, or None if there is none.
+    """
+    return storage.find(code)
+
+
 def search_shoe():
     """
     Search for a shoe by its code and print the result.
     """
     code = input("Enter shoe code to search: ")
 
-    for shoe in shoe_list:
-        if shoe.code == code:
-            print("\n===== SHOE FOUND =====")
-            print(tabulate([shoe], headers="keys", tablefmt="fancy_grid"))
-            print()
-            return shoe
+    shoe = find_shoe(code)
+    if shoe is not None:
+        print("\n===== SHOE FOUND =====")
+        print(render_table([shoe], headers="keys"))
+        print()
+        return shoe
 
     print("No shoe found with that code.")
     return None
@@ -189,27 +211,18 @@ def value_per_item():
     Calculate and display the total value of each shoe.
     Formula: value = cost * quantity
     """
-    if not shoe_list:
+    # Rows of [product, code, cost, quantity, value]
+    table = storage.values()
+    if not table:
         print("No shoes loaded.")
         return
 
-    table = []
-    for shoe in shoe_list:
-        value = shoe.cost * shoe.quantity
-        table.append([
-            shoe.product,
-            shoe.code,
-            shoe.cost,
-            shoe.quantity,
-            value
-        ])
-
     print("\n===== VALUE PER ITEM =====")
-    print(tabulate(
+    print(render_table(
         table,
-        headers=["Product", "Code", "Cost", "Qty", "Total Value"],
-        tablefmt="fancy_grid"
+        headers=["Product", "Code", "Cost", "Qty", "Total Value"]
     ))
+    print(f"Total stock value: {storage.total_value()}")
     print()
 
 
@@ -217,28 +230,23 @@ def highest_qty():
     """
     Display the shoe with the highest quantity.
     """
-    if not shoe_list:
+    highest = storage.highest()
+    if highest is None:
         print("No shoes loaded.")
         return
 
-    highest = max(shoe_list, key=lambda s: s.quantity)
-
     print("\n===== PRODUCT FOR SALE =====")
-    print(tabulate([highest], headers="keys", tablefmt="fancy_grid"))
+    print(render_table([highest], headers="keys"))
     print()
 
 
+@metrics.timed("update_inventory_file")
 def update_inventory_file():
     """
-    Rewrite inventory.txt with updated shoe quantities.
-    Ensures file stays in sync with shoe_list.
+    Write any pending changes to storage (rewrites inventory.txt
+    for the CSV backend).
     """
-    lines = ["Country,Code,Product,Cost,Quantity"]
-    for shoe in shoe_list:
-        lines.append(f"{shoe.country},{shoe.code},{shoe.product},{shoe.cost},{shoe.quantity}")
-
-    with open(file_path, "w") as file:
-        file.write("\n".join(lines))
+    storage.save()
 
 # ---------------------------------------------------------
 # Main Menu
@@ -248,6 +256,17 @@ def main():
     Display the main menu and execute user-selected actions.
     Runs inside a loop until the user chooses to exit.
     """
+    # Menu choices that run an action (timed, and profiled when INVENTORY_PROFILE is set)
+    actions = {
+        "1": metrics.timed("view_all")(view_all),
+        "2": metrics.timed("capture_shoes")(capture_shoes),
+        "3": metrics.timed("re_stock")(re_stock),
+        "4": metrics.timed("search_shoe")(search_shoe),
+        "5": metrics.timed("value_per_item")(value_per_item),
+        "6": metrics.timed("highest_qty")(highest_qty),
+    }
+
+    metrics.start()
     read_shoes_data()
 
     while True:
@@ -264,19 +283,13 @@ def main():
 
         choice = input("Enter your choice: ")
 
-        if choice == "1":
-            view_all()
-        elif choice == "2":
-            capture_shoes()
-        elif choice == "3":
-            re_stock()
-        elif choice == "4":
-            search_shoe()
-        elif choice == "5":
-            value_per_item()
-        elif choice == "6":
-            highest_qty()
+        if choice in actions:
+            action = actions[choice]
+            with metrics.profile(action.__name__):
+                action()
+            metrics.export()
         elif choice == "7":
+            storage.close()
             print("Exiting program.")
             break
         else:
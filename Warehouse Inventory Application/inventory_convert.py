@@ -0,0 +1,93 @@
+"""
+===========================================================
+ INVENTORY IMPORT / EXPORT TOOL
+-----------------------------------------------------------
+ File:    inventory_convert.py
+ Version: 1.0
+ Date:    19/10/2026
+ Author:  Annelli
+
+ Description:
+     Converts the warehouse inventory between the CSV
+     format (inventory.txt) and the SQLite format
+     (inventory.db). Rows are streamed in batches, so
+     files with millions of rows never have to fit in
+     memory.
+
+ Usage Example:
+     python inventory_convert.py to-sqlite inventory.txt inventory.db
+     python inventory_convert.py to-csv inventory.db inventory.txt
+===========================================================
+"""
+
+import argparse
+import os
+import time
+
+from inventory_storage import SqliteStorage, read_csv_rows, write_csv_rows
+
+
+def csv_to_sqlite(csv_path, db_path, replace=False):
+    """Import a CSV inventory into a new SQLite database. Returns the row count."""
+    if os.path.exists(db_path):
+        if not replace:
+            raise FileExistsError(f"{db_path} already exists (use --replace to overwrite it).")
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+
+    storage = SqliteStorage(db_path, record_type=None)
+    try:
+        return storage.add_rows(read_csv_rows(csv_path))
+    finally:
+        storage.close()
+
+
+def sqlite_to_csv(db_path, csv_path):
+    """Export an SQLite inventory to CSV. Returns the number of bytes written."""
+    if not os.path.exists(db_path):
+        raise FileNotFoundError(f"{db_path} not found.")
+
+    storage = SqliteStorage(db_path, record_type=None)
+    try:
+        return write_csv_rows(csv_path, storage.rows())
+    finally:
+        storage.close()
+
+
+# ---------------------------------------------------------
+# Main Program
+# ---------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Convert the inventory between CSV and SQLite.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    to_sqlite = subparsers.add_parser("to-sqlite", help="import a CSV file into SQLite")
+    to_sqlite.add_argument("csv_path")
+    to_sqlite.add_argument("db_path")
+    to_sqlite.add_argument("--replace", action="store_true", help="overwrite an existing database")
+
+    to_csv = subparsers.add_parser("to-csv", help="export an SQLite database to CSV")
+    to_csv.add_argument("db_path")
+    to_csv.add_argument("csv_path")
+
+    args = parser.parse_args()
+    start = time.perf_counter()
+
+    try:
+        if args.command == "to-sqlite":
+            rows = csv_to_sqlite(args.csv_path, args.db_path, args.replace)
+            print(f"Imported {rows:,} rows into {args.db_path}", end="")
+        else:
+            written = sqlite_to_csv(args.db_path, args.csv_path)
+            print(f"Exported {written:,} bytes to {args.csv_path}", end="")
+    except (FileExistsError, FileNotFoundError) as e:
+        raise SystemExit(f"Error: {e}")
+
+    print(f" in {time.perf_counter() - start:.2f} s.")
+
+
+if __name__ == "__main__":
+    main()
+
+# --------------------- End of Code -----------------------
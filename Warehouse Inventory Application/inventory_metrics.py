@@ -0,0 +1,258 @@
+"""
+===========================================================
+ INVENTORY METRICS AND PROFILING
+-----------------------------------------------------------
+ File:    inventory_metrics.py
+ Version: 1.0
+ Date:    19/10/2026
+ Author:  Annelli
+
+ Description:
+     Optional instrumentation for inventory.py:
+
+        • Per-operation latency histograms
+        • Counters (file bytes written, rows scanned, ...)
+        • cProfile / tracemalloc capture around menu actions
+        • Export in the Prometheus text format, to a file
+          and/or a local HTTP endpoint (/metrics)
+
+     Everything is controlled by environment variables that
+     are read once at import time:
+
+        INVENTORY_METRICS=1          turn metrics on
+        INVENTORY_METRICS_FILE=path  write metrics after each action
+        INVENTORY_METRICS_PORT=9100  serve http://127.0.0.1:9100/metrics
+        INVENTORY_PROFILE=cprofile   profile every menu action
+                         tracemalloc (or "cprofile,tracemalloc")
+
+Notes:
+    When metrics are off, timed() returns the function
+    unchanged and callers check ENABLED before counting, so
+    the disabled path costs a single attribute lookup.
+===========================================================
+"""
+
+import bisect
+import contextlib
+import cProfile
+import functools
+import io
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ENABLED = os.environ.get("INVENTORY_METRICS", "") not in ("", "0")
+METRICS_FILE = os.environ.get("INVENTORY_METRICS_FILE", "")
+METRICS_PORT = int(os.environ.get("INVENTORY_METRICS_PORT", "0") or 0)
+PROFILE_MODES = {mode.strip() for mode in os.environ.get("INVENTORY_PROFILE", "").split(",") if mode.strip()}
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiles")
+
+
+# ---------------------------------------------------------
+# Metric types
+# ---------------------------------------------------------
+class Histogram:
+    """
+    A latency histogram with fixed buckets, as used by Prometheus.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+# operation name -> Histogram
+histograms = {}
+
+# counter name -> (value, help text)
+counters = {}
+
+_lock = threading.Lock()
+
+
+# ---------------------------------------------------------
+# Recording
+# ---------------------------------------------------------
+def timed(operation):
+    """
+    Decorator recording the latency of each call under `operation`.
+    Returns the function unchanged when metrics are disabled.
+    """
+    def decorator(func):
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                observe(operation, time.perf_counter() - start)
+        return wrapper
+
+    return decorator
+
+
+def observe(operation, seconds):
+    """Record one latency measurement."""
+    with _lock:
+        histogram = histograms.get(operation)
+        if histogram is None:
+            histogram = histograms[operation] = Histogram()
+        histogram.observe(seconds)
+
+
+def count(name, amount=1, help_text=""):
+    """Add `amount` to the counter `name`. Callers should check ENABLED first."""
+    with _lock:
+        value, existing_help = counters.get(name, (0, help_text))
+        counters[name] = (value + amount, existing_help or help_text)
+
+
+# ---------------------------------------------------------
+# Prometheus text export
+# ---------------------------------------------------------
+def _format_bound(bound):
+    return f"{bound:g}"
+
+
+def render():
+    """Return all metrics in the Prometheus text exposition format."""
+    lines = []
+    with _lock:
+        if histograms:
+            lines.append("# HELP inventory_operation_seconds Latency of inventory operations.")
+            lines.append("# TYPE inventory_operation_seconds histogram")
+            for operation, histogram in sorted(histograms.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(histogram.buckets, histogram.counts):
+                    cumulative += bucket_count
+                    lines.append(f'inventory_operation_seconds_bucket{{operation="{operation}",'
+                                 f'le="{_format_bound(bound)}"}} {cumulative}')
+                lines.append(f'inventory_operation_seconds_bucket{{operation="{operation}",le="+Inf"}} '
+                             f'{histogram.count}')
+                lines.append(f'inventory_operation_seconds_sum{{operation="{operation}"}} {histogram.total}')
+                lines.append(f'inventory_operation_seconds_count{{operation="{operation}"}} {histogram.count}')
+
+        for name, (value, help_text) in sorted(counters.items()):
+            metric = f"inventory_{name}_total"
+            if help_text:
+                lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+
+    return "\n".join(lines) + "\n"
+
+
+def write_metrics(path=None):
+    """Write the metrics to `path` (default: INVENTORY_METRICS_FILE)."""
+    path = path or METRICS_FILE
+    if not path:
+        return
+
+    # Write to a temporary file first so scrapers never see a half-written file
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as file:
+        file.write(render())
+    os.replace(temp_path, path)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+        body = render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # keep the menu output clean
+
+
+def start_http_server(port=None):
+    """Serve /metrics on 127.0.0.1 from a background thread. Returns the server."""
+    server = ThreadingHTTPServer(("127.0.0.1", port or METRICS_PORT), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def start():
+    """Start the configured exporters. Does nothing when metrics are disabled."""
+    if ENABLED and METRICS_PORT:
+        start_http_server()
+        print(f"Metrics available at http://127.0.0.1:{METRICS_PORT}/metrics")
+
+
+def export():
+    """Write the metrics file if one is configured."""
+    if ENABLED and METRICS_FILE:
+        write_metrics()
+
+
+# ---------------------------------------------------------
+# Profiling
+# ---------------------------------------------------------
+@contextlib.contextmanager
+def _profiled(action):
+    """Run the block under cProfile and/or tracemalloc and report the results."""
+    profiler = cProfile.Profile() if "cprofile" in PROFILE_MODES else None
+    tracing = "tracemalloc" in PROFILE_MODES and not tracemalloc.is_tracing()
+
+    if tracing:
+        tracemalloc.start()
+    if profiler:
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler:
+            profiler.disable()
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            path = os.path.join(PROFILE_DIR, f"{action}-{time.strftime('%Y%m%d-%H%M%S')}.prof")
+            profiler.dump_stats(path)
+
+            report = io.StringIO()
+            pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(10)
+            print(f"\n===== PROFILE: {action} (saved to {path}) =====")
+            print(report.getvalue())
+
+        if tracing:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            print(f"\n===== MEMORY: {action} (peak {peak / 1024:,.1f} KiB) =====")
+            for stat in snapshot.statistics("lineno")[:10]:
+                print(stat)
+            print()
+
+
+def profile(action):
+    """
+    Context manager profiling a menu action when INVENTORY_PROFILE is set.
+    Returns a no-op context otherwise.
+    """
+    if not PROFILE_MODES:
+        return contextlib.nullcontext()
+    return _profiled(action)
+
+# --------------------- End of Code -----------------------
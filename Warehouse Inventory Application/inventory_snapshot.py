@@ -0,0 +1,311 @@
+"""
+===========================================================
+ INVENTORY BINARY SNAPSHOT
+-----------------------------------------------------------
+ File:    inventory_snapshot.py
+ Version: 1.0
+ Date:    19/10/2026
+ Author:  Annelli
+
+ Description:
+     A versioned binary copy of inventory.txt that can be
+     memory-mapped at startup instead of re-parsing the
+     text file. The snapshot is written next to the CSV file
+     (inventory.snap) by the CSV storage backend and is
+     rebuilt automatically when it is missing, was made from
+     a different version of the CSV file, or is corrupt.
+
+ File layout (little-endian):
+
+     header   64 bytes   magic, version, row and string
+                         counts, size and mtime of the CSV
+                         file it was built from, CRC-32 of
+                         everything after the header
+     cost     int64[rows]
+     quantity int64[rows]
+     country  uint32[rows]  \\
+     code     uint32[rows]   > indexes into the string table
+     product  uint32[rows]  /
+     (padding to a multiple of 8 bytes)
+     offsets  uint64[strings + 1]   string table offsets
+     blob     UTF-8 bytes of all unique strings
+
+     Columns are read straight from the memory map as
+     memoryviews (or NumPy arrays when NumPy is installed),
+     without copying.
+
+Notes:
+    Set INVENTORY_SNAPSHOT=0 to turn snapshots off. Snapshots
+    are only used on little-endian machines.
+===========================================================
+"""
+
+import array
+import gc
+import mmap
+import operator
+import os
+import struct
+import sys
+import zlib
+
+import inventory_metrics as metrics
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+ENABLED = os.environ.get("INVENTORY_SNAPSHOT", "1") != "0" and sys.byteorder == "little"
+
+MAGIC = b"INVSNAP\0"
+VERSION = 1
+
+# magic, version, rows, strings, blob size, CSV mtime (ns), CSV size, CRC-32
+_HEADER = struct.Struct("<8sIQQQqQI8x")
+assert _HEADER.size == 64
+
+STRING_COLUMNS = ("country", "code", "product")
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot file is missing, out of date or corrupt."""
+
+
+def snapshot_path(csv_path):
+    """Return the snapshot path for a CSV inventory file."""
+    return os.path.splitext(csv_path)[0] + ".snap"
+
+
+def _padding(size):
+    return -size % 8
+
+
+# ---------------------------------------------------------
+# Writing
+# ---------------------------------------------------------
+@metrics.timed("write_snapshot")
+def write_snapshot(csv_path, rows):
+    """
+    Write the snapshot for csv_path from (country, code, product, cost, quantity) rows.
+    The CSV file must already be up to date, because its size and mtime are recorded.
+    """
+    cost = array.array("q")
+    quantity = array.array("q")
+    string_columns = {name: array.array("I") for name in STRING_COLUMNS}
+    string_index = {}
+
+    for country, code, product, row_cost, row_quantity in rows:
+        cost.append(row_cost)
+        quantity.append(row_quantity)
+        for name, value in zip(STRING_COLUMNS, (country, code, product)):
+            index = string_index.get(value)
+            if index is None:
+                index = string_index[value] = len(string_index)
+            string_columns[name].append(index)
+
+    # String table: offsets into one blob of UTF-8 bytes
+    encoded = [value.encode("utf-8") for value in string_index]
+    offsets = array.array("Q", [0])
+    position = 0
+    for value in encoded:
+        position += len(value)
+        offsets.append(position)
+    blob = b"".join(encoded)
+
+    string_bytes = sum(len(column) * 4 for column in string_columns.values())
+    parts = [cost, quantity, *string_columns.values(),
+             bytes(_padding(string_bytes)), offsets, blob]
+
+    crc = 0
+    for part in parts:
+        crc = zlib.crc32(part, crc)
+
+    stat = os.stat(csv_path)
+    header = _HEADER.pack(MAGIC, VERSION, len(cost), len(encoded), len(blob),
+                          stat.st_mtime_ns, stat.st_size, crc)
+
+    # Write to a temporary file first so a crash never leaves half a snapshot
+    path = snapshot_path(csv_path)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as file:
+        file.write(header)
+        for part in parts:
+            file.write(part)
+    os.replace(temp_path, path)
+
+
+# ---------------------------------------------------------
+# Reading
+# ---------------------------------------------------------
+class Snapshot:
+    """
+    A memory-mapped snapshot. Column properties are zero-copy views into
+    the file; call close() (or use `with`) when finished with them.
+
+    A column keeps the memory map alive for as long as it is referenced.
+    close() never fails because of that: the snapshot itself can no longer
+    be used, and the map is released once the last column is gone.
+    """
+
+    def __init__(self, path, verify=True):
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._parse(verify)
+        except Exception:
+            self._mmap.close()
+            raise
+
+    def _parse(self, verify):
+        if len(self._mmap) < _HEADER.size:
+            raise SnapshotError("Snapshot is too short.")
+
+        (magic, version, self.row_count, self.string_count, blob_size,
+         self.source_mtime_ns, self.source_size, crc) = _HEADER.unpack_from(self._mmap)
+
+        if magic != MAGIC:
+            raise SnapshotError("Not an inventory snapshot.")
+        if version != VERSION:
+            raise SnapshotError(f"Unsupported snapshot version {version}.")
+
+        rows = self.row_count
+        string_bytes = 3 * 4 * rows
+        layout = [("cost", 8 * rows), ("quantity", 8 * rows),
+                  *((name, 4 * rows) for name in STRING_COLUMNS),
+                  ("padding", _padding(string_bytes)),
+                  ("offsets", 8 * (self.string_count + 1)), ("blob", blob_size)]
+
+        self._offsets = {}
+        position = _HEADER.size
+        for name, size in layout:
+            self._offsets[name] = (position, position + size)
+            position += size
+
+        if position != len(self._mmap):
+            raise SnapshotError("Snapshot size does not match its header.")
+
+        view = memoryview(self._mmap)
+        try:
+            if verify and zlib.crc32(view[_HEADER.size:]) != crc:
+                raise SnapshotError("Snapshot checksum mismatch.")
+        finally:
+            view.release()
+
+        self._strings = None
+
+    @property
+    def _data(self):
+        if self._mmap is None:
+            raise ValueError("Snapshot is closed.")
+        return self._mmap
+
+    def _column(self, name, fmt):
+        start, end = self._offsets[name]
+        if np is not None:
+            return np.frombuffer(self._data, dtype="<i8" if fmt == "q" else "<u4",
+                                 count=(end - start) // struct.calcsize(fmt), offset=start)
+        return memoryview(self._data)[start:end].cast(fmt)
+
+    @property
+    def cost(self):
+        return self._column("cost", "q")
+
+    @property
+    def quantity(self):
+        return self._column("quantity", "q")
+
+    def string_indexes(self, name):
+        """Indexes into self.strings for the country, code or product column."""
+        return self._column(name, "I")
+
+    @property
+    def strings(self):
+        """The decoded string table (decoded once, on first use)."""
+        if self._strings is None:
+            start, end = self._offsets["offsets"]
+            offsets = memoryview(self._data)[start:end].cast("Q")
+            blob_start = self._offsets["blob"][0]
+            data = self._data
+            self._strings = [data[blob_start + offsets[i]:blob_start + offsets[i + 1]].decode("utf-8")
+                             for i in range(self.string_count)]
+            offsets.release()
+        return self._strings
+
+    def records(self, record_type):
+        """Build record_type(country, code, product, cost, quantity) for every row."""
+        if self.row_count == 0:
+            return []
+
+        columns = []
+        for name, fmt in (("country", "I"), ("code", "I"), ("product", "I"), ("cost", "q"), ("quantity", "q")):
+            start, end = self._offsets[name]
+            with memoryview(self._data)[start:end] as raw, raw.cast(fmt) as view:
+                columns.append(view.tolist())
+
+        # Look up every string index at once
+        strings = self.strings
+        for i in range(3):
+            looked_up = operator.itemgetter(*columns[i])(strings)
+            columns[i] = looked_up if self.row_count > 1 else (looked_up,)
+
+        # Creating a million small objects triggers many pointless garbage
+        # collections (none of them can be freed), so pause the collector
+        was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return list(map(record_type, *columns))
+        finally:
+            if was_enabled:
+                gc.enable()
+
+    def close(self):
+        if self._mmap is None:
+            return
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass  # Columns are still in use; the map closes when they are freed
+        self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_snapshot(csv_path, verify=True):
+    """
+    Open the snapshot for csv_path. Raises SnapshotError if it is missing,
+    was built from a different version of the CSV file, or is corrupt.
+    """
+    path = snapshot_path(csv_path)
+    if not os.path.exists(path):
+        raise SnapshotError("No snapshot.")
+
+    snapshot = Snapshot(path, verify)
+    stat = os.stat(csv_path)
+    if (snapshot.source_mtime_ns, snapshot.source_size) != (stat.st_mtime_ns, stat.st_size):
+        snapshot.close()
+        raise SnapshotError("Snapshot is older than the CSV file.")
+    return snapshot
+
+
+@metrics.timed("load_snapshot")
+def load_records(csv_path, record_type):
+    """
+    Return the records from a valid snapshot of csv_path, or None if the
+    snapshot is disabled, missing, out of date or corrupt.
+    """
+    if not ENABLED:
+        return None
+
+    try:
+        with open_snapshot(csv_path) as snapshot:
+            return snapshot.records(record_type)
+    except (SnapshotError, OSError, ValueError, struct.error):
+        return None
+
+# --------------------- End of Code -----------------------
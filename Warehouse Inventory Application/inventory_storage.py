@@ -0,0 +1,380 @@
+"""
+===========================================================
+ INVENTORY STORAGE BACKENDS
+-----------------------------------------------------------
+ File:    inventory_storage.py
+ Version: 1.0
+ Date:    19/10/2026
+ Author:  Annelli
+
+ Description:
+     Storage backends used by inventory.py. Both backends
+     offer the same methods, so the menu functions do not
+     need to know where the shoes are kept:
+
+        • CsvStorage    – the original flat inventory.txt,
+                          held in memory as a list and
+                          rewritten in full on every change.
+                          Startup reads a binary snapshot
+                          (inventory_snapshot.py) when one
+                          is up to date; a change removes
+                          the snapshot and the next startup
+                          rebuilds it.
+        • SqliteStorage – an SQLite database (WAL mode) with
+                          indexes on code and quantity.
+                          Searches, lowest/highest stock and
+                          valuations run as SQL queries.
+
+     Records are created with the `record_type` passed in
+     (the Shoe class), called with the columns in the order
+     country, code, product, cost, quantity.
+
+Notes:
+    Python's sqlite3 module caches prepared statements per
+    connection, so the SQL below is written as constant
+    strings with ? placeholders to be reused.
+===========================================================
+"""
+
+import itertools
+import os
+import sqlite3
+
+import inventory_metrics as metrics
+import inventory_snapshot
+
+CSV_HEADER = "Country,Code,Product,Cost,Quantity"
+
+# Rows inserted per transaction when importing
+BATCH_SIZE = 50_000
+
+
+# ---------------------------------------------------------
+# CSV helpers
+# ---------------------------------------------------------
+def read_csv_rows(path):
+    """
+    Yield (country, code, product, cost, quantity) tuples from an inventory file.
+    """
+    with open(path, "r") as file:
+        next(file)  # Skip header line
+
+        for line in file:
+            if line.strip() == "":
+                continue  # Skip empty lines
+
+            country, code, product, cost, quantity = line.strip().split(",")
+            yield country, code, product, int(cost), int(quantity)
+
+
+def write_csv_rows(path, rows):
+    """
+    Write (country, code, product, cost, quantity) rows to an inventory file,
+    BATCH_SIZE lines at a time. Returns the number of bytes written.
+    """
+    lines = (f"\n{country},{code},{product},{cost},{quantity}"
+             for country, code, product, cost, quantity in rows)
+
+    with open(path, "w") as file:
+        file.write(CSV_HEADER)
+        written = len(CSV_HEADER)
+
+        while batch := "".join(itertools.islice(lines, BATCH_SIZE)):
+            file.write(batch)
+            written += len(batch.encode())
+
+    return written
+
+
+def _count_scanned(rows):
+    if metrics.ENABLED:
+        metrics.count("rows_scanned", rows, "Rows examined by searches and scans.")
+
+
+# ---------------------------------------------------------
+# CSV backend
+# ---------------------------------------------------------
+class CsvStorage:
+    """
+    The original flat-file storage: every record is kept in `records`
+    and the whole file is rewritten on each change.
+    """
+
+    def __init__(self, path, record_type, records=None):
+        self.path = path
+        self.record_type = record_type
+        self.records = records if records is not None else []
+
+    def load(self):
+        """
+        Read the file into self.records. A valid binary snapshot is used
+        when there is one; otherwise the CSV is parsed and the snapshot rebuilt.
+        """
+        records = inventory_snapshot.load_records(self.path, self.record_type)
+        if records is None:
+            records = [self.record_type(*row) for row in read_csv_rows(self.path)]
+            self._write_snapshot(records)
+
+        self.records.clear()
+        self.records.extend(records)
+
+        if metrics.ENABLED:
+            metrics.count("rows_loaded", len(self.records), "Rows read from the inventory file.")
+
+    def save(self):
+        """Rewrite the file from self.records."""
+        written = write_csv_rows(self.path, ((r.country, r.code, r.product, r.cost, r.quantity)
+                                             for r in self.records))
+
+        if metrics.ENABLED:
+            metrics.count("file_bytes_written", written, "Bytes written to the inventory file.")
+
+        # The snapshot is now out of date. Rather than rebuilding it on every
+        # change, remove it so the next load() parses the CSV and rebuilds it
+        self._remove_snapshot()
+
+    def _write_snapshot(self, records):
+        """
+        Refresh the binary snapshot. A snapshot that cannot be written (or whose
+        costs or quantities do not fit in 64 bits) is skipped.
+        """
+        if not inventory_snapshot.ENABLED:
+            return
+        try:
+            inventory_snapshot.write_snapshot(
+                self.path, ((r.country, r.code, r.product, r.cost, r.quantity) for r in records))
+        except (OSError, OverflowError):
+            pass
+
+    def _remove_snapshot(self):
+        try:
+            os.remove(inventory_snapshot.snapshot_path(self.path))
+        except FileNotFoundError:
+            pass
+
+    def count(self):
+        return len(self.records)
+
+    def all(self):
+        return list(self.records)
+
+    def add(self, record):
+        self.records.append(record)
+        self.save()
+
+    def update_quantity(self, record):
+        """Persist a changed quantity (the record is already in self.records)."""
+        self.save()
+
+    def find(self, code):
+        for position, record in enumerate(self.records, 1):
+            if record.code == code:
+                _count_scanned(position)
+                return record
+
+        _count_scanned(len(self.records))
+        return None
+
+    def lowest(self):
+        if not self.records:
+            return None
+        _count_scanned(len(self.records))
+        return min(self.records, key=lambda r: r.quantity)
+
+    def highest(self):
+        if not self.records:
+            return None
+        _count_scanned(len(self.records))
+        return max(self.records, key=lambda r: r.quantity)
+
+    def values(self):
+        """Return [product, code, cost, quantity, cost * quantity] for every record."""
+        _count_scanned(len(self.records))
+        return [[r.product, r.code, r.cost, r.quantity, r.cost * r.quantity] for r in self.records]
+
+    def total_value(self):
+        _count_scanned(len(self.records))
+        return sum(r.cost * r.quantity for r in self.records)
+
+    def rows(self):
+        """Yield every record as a plain tuple (used for exporting)."""
+        for r in self.records:
+            yield r.country, r.code, r.product, r.cost, r.quantity
+
+    def close(self):
+        pass
+
+
+# ---------------------------------------------------------
+# SQLite backend
+# ---------------------------------------------------------
+_COLUMNS = "country, code, product, cost, quantity"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS shoes (
+    id       INTEGER PRIMARY KEY,
+    country  TEXT    NOT NULL,
+    code     TEXT    NOT NULL,
+    product  TEXT    NOT NULL,
+    cost     INTEGER NOT NULL,
+    quantity INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_shoes_code ON shoes (code);
+CREATE INDEX IF NOT EXISTS idx_shoes_quantity ON shoes (quantity);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Set while a new database still has to be filled from the CSV file
+_MARK_IMPORT_PENDING = "INSERT OR REPLACE INTO meta (key, value) VALUES ('import_pending', '1')"
+_IMPORT_PENDING = "SELECT 1 FROM meta WHERE key = 'import_pending'"
+_CLEAR_IMPORT_PENDING = "DELETE FROM meta WHERE key = 'import_pending'"
+
+_INSERT = f"INSERT INTO shoes ({_COLUMNS}) VALUES (?, ?, ?, ?, ?)"
+_SELECT_ALL = f"SELECT {_COLUMNS} FROM shoes ORDER BY id"
+# Queries that return records also return the row id, so an update
+# reaches the same row even when several shoes share a code
+_SELECT_RECORDS = f"SELECT id, {_COLUMNS} FROM shoes ORDER BY id"
+_FIND = f"SELECT id, {_COLUMNS} FROM shoes WHERE code = ? ORDER BY id LIMIT 1"
+# MIN()/MAX() are answered from the quantity index, and ties go to the
+# earliest row, like min()/max() over the CSV list
+_LOWEST = (f"SELECT id, {_COLUMNS} FROM shoes "
+           "WHERE quantity = (SELECT MIN(quantity) FROM shoes) ORDER BY id LIMIT 1")
+_HIGHEST = (f"SELECT id, {_COLUMNS} FROM shoes "
+            "WHERE quantity = (SELECT MAX(quantity) FROM shoes) ORDER BY id LIMIT 1")
+_VALUES = "SELECT product, code, cost, quantity, cost * quantity FROM shoes ORDER BY id"
+_TOTAL_VALUE = "SELECT COALESCE(SUM(cost * quantity), 0) FROM shoes"
+_UPDATE_QUANTITY = "UPDATE shoes SET quantity = ? WHERE id = ?"
+
+
+class SqliteStorage:
+    """
+    SQLite storage with indexes on code and quantity.
+
+    Records returned by this backend remember their row id (in a
+    `_rowid` attribute), which update_quantity() uses to find the row.
+    """
+
+    def __init__(self, path, record_type, source_csv=None):
+        self.path = path
+        self.record_type = record_type
+        # A new database is filled from this CSV file by load()
+        self.source_csv = source_csv
+        is_new = not os.path.exists(path)
+
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.executescript(_SCHEMA)
+
+        if is_new and source_csv is not None:
+            with self.connection:
+                self.connection.execute(_MARK_IMPORT_PENDING)
+
+    def load(self):
+        """
+        Nothing is read into memory: queries run against the database.
+        A new database is first filled from source_csv. The import is only
+        marked as done once every row is in, so an import that failed (a
+        missing file or a bad line) is started again from scratch next time.
+        """
+        if self.source_csv is None or self.connection.execute(_IMPORT_PENDING).fetchone() is None:
+            return
+
+        rows = read_csv_rows(self.source_csv)
+        with self.connection:
+            self.connection.execute("DELETE FROM shoes")  # Rows left by a failed import
+        self.add_rows(rows)
+
+        with self.connection:
+            self.connection.execute(_CLEAR_IMPORT_PENDING)
+
+    def save(self):
+        self.connection.commit()
+
+    def count(self):
+        return self.connection.execute("SELECT COUNT(*) FROM shoes").fetchone()[0]
+
+    def _record(self, row):
+        """Build a record from an (id, country, code, product, cost, quantity) row."""
+        if row is None:
+            return None
+        record = self.record_type(*row[1:])
+        record._rowid = row[0]
+        return record
+
+    def all(self):
+        return [self._record(row) for row in self.connection.execute(_SELECT_RECORDS)]
+
+    def add(self, record):
+        with self.connection:
+            cursor = self.connection.execute(_INSERT, (record.country, record.code, record.product,
+                                                       record.cost, record.quantity))
+        record._rowid = cursor.lastrowid
+
+    def add_rows(self, rows, batch_size=BATCH_SIZE):
+        """Insert (country, code, product, cost, quantity) tuples in batched transactions."""
+        rows = iter(rows)
+        inserted = 0
+        while batch := list(itertools.islice(rows, batch_size)):
+            with self.connection:
+                self.connection.executemany(_INSERT, batch)
+            inserted += len(batch)
+        return inserted
+
+    def update_quantity(self, record):
+        """Persist a changed quantity for a record returned by this backend."""
+        rowid = getattr(record, "_rowid", None)
+        if rowid is None:
+            raise ValueError("The record was not read from this database.")
+
+        with self.connection:
+            self.connection.execute(_UPDATE_QUANTITY, (record.quantity, rowid))
+
+    def find(self, code):
+        return self._record(self.connection.execute(_FIND, (code,)).fetchone())
+
+    def lowest(self):
+        return self._record(self.connection.execute(_LOWEST).fetchone())
+
+    def highest(self):
+        return self._record(self.connection.execute(_HIGHEST).fetchone())
+
+    def values(self):
+        return [list(row) for row in self.connection.execute(_VALUES)]
+
+    def total_value(self):
+        return self.connection.execute(_TOTAL_VALUE).fetchone()[0]
+
+    def rows(self):
+        """Yield every row as a plain tuple (used for exporting)."""
+        yield from self.connection.execute(_SELECT_ALL)
+
+    def close(self):
+        self.connection.close()
+
+
+# ---------------------------------------------------------
+# Opening a backend
+# ---------------------------------------------------------
+BACKENDS = ("csv", "sqlite")
+
+
+def open_storage(backend, csv_path, record_type, records=None):
+    """
+    Create the named backend for the inventory stored at csv_path.
+    Call load() on the result before using it.
+
+    The SQLite database lives next to the CSV file (same name, .db).
+    When it does not exist yet it is filled from the CSV file on load().
+    """
+    if backend == "csv":
+        return CsvStorage(csv_path, record_type, records)
+    if backend == "sqlite":
+        db_path = os.path.splitext(csv_path)[0] + ".db"
+        return SqliteStorage(db_path, record_type, source_csv=csv_path)
+    raise ValueError(f"Unknown storage backend '{backend}'. Choose one of {BACKENDS}.")
+
+# --------------------- End of Code -----------------------
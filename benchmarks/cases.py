@@ -0,0 +1,195 @@
+"""
+===========================================================
+Benchmark Cases
+-----------------------------------------------------------
+ File:    cases.py
+ Version: 1.0
+ Date:    19/10/2026
+ Author:  Annelli
+
+ Description:
+     Defines the benchmark cases used by run_benchmarks.py.
+     Each case loads a project module straight from its file
+     (the project folders contain spaces, so they cannot be
+     imported as packages) and drives its pure functions
+     without a terminal.
+
+     A case is a function that takes an input size and
+     returns a zero-argument callable doing one unit of work
+     at that size. Setup (data generation, temporary files)
+     happens before the callable is returned and is not
+     timed.
+===========================================================
+"""
+
+import atexit
+import contextlib
+import importlib.util
+import io
+import os
+import random
+import shutil
+import sys
+import tempfile
+
+repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Fixed seed so every run benchmarks the same data
+SEED = 2026
+
+
+# ---------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------
+_modules = {}
+
+
+def load_module(name, *path_parts):
+    """Load (once) and return the module at repo_dir/path_parts."""
+    if name not in _modules:
+        path = os.path.join(repo_dir, *path_parts)
+
+        # Let the module import its sibling files
+        module_dir = os.path.dirname(path)
+        if module_dir not in sys.path:
+            sys.path.insert(0, module_dir)
+
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[name] = module
+    return _modules[name]
+
+
+def _inventory():
+    return load_module("inventory", "Warehouse Inventory Application", "inventory.py")
+
+
+def _write_inventory_csv(path, rows):
+    """Write an inventory file with the given number of rows."""
+    rng = random.Random(SEED)
+    with open(path, "w") as file:
+        file.write("Country,Code,Product,Cost,Quantity")
+        for i in range(rows):
+            file.write(f"\nCountry {i % 50},SKU{i:08d},Product {i % 500},"
+                       f"{rng.randint(100, 5000)},{rng.randint(0, 100)}")
+
+
+def _inventory_temp_file(rows):
+    """Point the inventory module at a fresh temporary file and load it."""
+    inventory = _inventory()
+    directory = tempfile.mkdtemp(prefix="inventory_bench_")
+    atexit.register(shutil.rmtree, directory, ignore_errors=True)
+    inventory.file_path = os.path.join(directory, "inventory.txt")
+    _write_inventory_csv(inventory.file_path, rows)
+
+    inventory.shoe_list.clear()
+    with contextlib.redirect_stdout(io.StringIO()):
+        inventory.read_shoes_data()
+    return inventory
+
+
+# ---------------------------------------------------------
+# Cases
+# ---------------------------------------------------------
+def minesweeper_case(size):
+    """Annotate a size x size board with 20% mines."""
+    module = load_module("minesweeper", "Data Structures – 2D Lists", "minesweeper.py")
+    rng = random.Random(SEED)
+    grid = [["#" if rng.random() < 0.2 else "-" for _ in range(size)] for _ in range(size)]
+    return lambda: module.minesweeper(grid)
+
+
+def adding_up_to_case(size):
+    """Recursively sum a list of the given length."""
+    module = load_module("sum_recursion", "Recursion", "Recursive Summation", "sum_recursion.py")
+    rng = random.Random(SEED)
+    numbers = [rng.randint(-1000, 1000) for _ in range(size)]
+    return lambda: module.adding_up_to(numbers, size - 1)
+
+
+def largest_number_case(size):
+    """Recursively find the largest number in a list of the given length."""
+    module = load_module("largest_number", "Recursion", "Recursive Maximum Finder", "largest_number.py")
+    rng = random.Random(SEED)
+    numbers = [rng.random() for _ in range(size)]
+    return lambda: module.largest_number(numbers)
+
+
+def holiday_cost_case(size):
+    """Price `size` random itineraries."""
+    module = load_module("holiday", "Holiday Cost Calculator", "holiday.py")
+    rng = random.Random(SEED)
+    cities = ["Cape Town", "Johannesburg", "Durban", "Bloemfontein"]
+    trips = [(rng.randint(1, 30), rng.choice(cities), rng.randint(1, 30)) for _ in range(size)]
+
+    def run():
+        for nights, city, days in trips:
+            module.holiday_cost(nights, city, days)
+    return run
+
+
+def calculate_bmi_case(size):
+    """Call calculate_bmi() for `size` valid weight/height pairs."""
+    module = load_module("logic", "Defensive Programming – Error Handling", "logic.py")
+    rng = random.Random(SEED)
+    people = [(rng.uniform(40, 150), rng.uniform(1.4, 2.1)) for _ in range(size)]
+
+    def run():
+        for weight, height in people:
+            module.calculate_bmi(weight, height)
+    return run
+
+
+def finance_formulas_case(size):
+    """Evaluate the simple, compound and bond formulas `size` times each."""
+    module = load_module("finance_calculators", "Financial Calculators", "finance_calculators.py")
+    rng = random.Random(SEED)
+    inputs = [(rng.uniform(1e3, 1e6), rng.uniform(0.01, 0.2), rng.randint(1, 30)) for _ in range(size)]
+
+    def run():
+        for principal, rate, years in inputs:
+            module.simple_interest(principal, rate, years)
+            module.compound_interest(principal, rate, years, 12)
+            module.bond_repayment(principal, rate * 100, years * 12)
+    return run
+
+
+def inventory_load_case(size):
+    """Read an inventory file of `size` rows."""
+    inventory = _inventory_temp_file(size)
+
+    def run():
+        inventory.shoe_list.clear()
+        with contextlib.redirect_stdout(io.StringIO()):
+            inventory.read_shoes_data()
+    return run
+
+
+def inventory_search_case(size):
+    """Search for the last code in an inventory of `size` rows (worst case)."""
+    inventory = _inventory_temp_file(size)
+    code = f"SKU{size - 1:08d}"
+    return lambda: inventory.find_shoe(code)
+
+
+def inventory_update_case(size):
+    """Rewrite an inventory file of `size` rows."""
+    inventory = _inventory_temp_file(size)
+    return inventory.update_inventory_file
+
+
+# name -> (case function, input sizes)
+CASES = {
+    "minesweeper": (minesweeper_case, [10, 50, 200]),
+    "adding_up_to": (adding_up_to_case, [100, 400, 900]),
+    "largest_number": (largest_number_case, [1_000, 10_000, 100_000]),
+    "holiday_cost": (holiday_cost_case, [1_000, 10_000, 100_000]),
+    "calculate_bmi": (calculate_bmi_case, [1_000, 10_000, 100_000]),
+    "finance_formulas": (finance_formulas_case, [1_000, 10_000, 100_000]),
+    "inventory_load": (inventory_load_case, [1_000, 10_000, 100_000]),
+    "inventory_search": (inventory_search_case, [1_000, 10_000, 100_000]),
+    "inventory_update": (inventory_update_case, [1_000, 10_000, 100_000]),
+}
+
+# ============== END OF CODE ==============
@@ -0,0 +1,201 @@
+"""
+===========================================================
+Benchmark Runner
+-----------------------------------------------------------
+ File:    run_benchmarks.py
+ Version: 1.0
+ Date:    19/10/2026
+ Author:  Annelli
+
+ Description:
+     Runs every case in cases.py at each of its input sizes
+     and records the median wall-clock time of several runs
+     and the peak memory allocated (tracemalloc) to a JSON
+     file.
+
+     When a baseline is given, each result is compared with
+     it and the program exits with status 1 if the time is
+     worse than the baseline by more than the time threshold
+     (default 50%) or the peak memory by more than the
+     memory threshold (default 25%). Time differences below
+     10 ms are ignored as timer noise.
+     Results without a baseline at the same size (e.g. with
+     --scale) are reported as not compared.
+
+     --update-baseline merges the results into the existing
+     baseline, so the other cases keep their values.
+
+ Usage Example:
+     python benchmarks/run_benchmarks.py
+     python benchmarks/run_benchmarks.py --case minesweeper --scale 0.5
+     python benchmarks/run_benchmarks.py --update-baseline
+===========================================================
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+from cases import CASES
+
+benchmarks_dir = os.path.dirname(os.path.abspath(__file__))
+default_baseline = os.path.join(benchmarks_dir, "baseline.json")
+default_output = os.path.join(benchmarks_dir, "results.json")
+
+# Differences below these are treated as noise, whatever the threshold
+MIN_SECONDS_DIFFERENCE = 0.010
+MIN_BYTES_DIFFERENCE = 64 * 1024
+
+
+# ---------------------------------------------------------
+# Measuring
+# ---------------------------------------------------------
+def measure(run, repeat):
+    """Return (median_seconds, peak_bytes) for the zero-argument callable run."""
+    run()  # warm-up
+
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+
+    # Peak memory is measured separately because tracemalloc slows things down
+    gc.collect()
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return statistics.median(times), peak
+
+
+def run_cases(names, scale, repeat):
+    """Run the selected cases and return {case: {size: {...}}}."""
+    results = {}
+    for name in names:
+        case, sizes = CASES[name]
+        results[name] = {}
+        for size in sizes:
+            size = max(1, int(size * scale))
+            seconds, peak = measure(case(size), repeat)
+            results[name][str(size)] = {"seconds": seconds, "peak_bytes": peak}
+            print(f"{name:<20}{size:>10,}{seconds * 1000:>14.3f} ms{peak / 1024:>14,.1f} KiB")
+    return results
+
+
+# ---------------------------------------------------------
+# Baseline comparison
+# ---------------------------------------------------------
+def find_regressions(results, baseline, time_threshold, memory_threshold):
+    """
+    Return (regression messages, number of results that had a baseline to compare with).
+    """
+    regressions = []
+    compared = 0
+    for name, sizes in results.items():
+        for size, current in sizes.items():
+            previous = baseline.get(name, {}).get(size)
+            if previous is None:
+                continue
+            compared += 1
+
+            checks = [
+                ("time", "seconds", MIN_SECONDS_DIFFERENCE, time_threshold),
+                ("peak memory", "peak_bytes", MIN_BYTES_DIFFERENCE, memory_threshold),
+            ]
+            for label, key, floor, threshold in checks:
+                old, new = previous[key], current[key]
+                if new - old > floor and new > old * (1 + threshold):
+                    regressions.append(f"{name} (n={size}): {label} {old:.6g} -> {new:.6g} "
+                                       f"(+{(new / old - 1) * 100:.0f}%)")
+    return regressions, compared
+
+
+def merge_baseline(path, results):
+    """
+    Merge results into the existing baseline at path, so updating only some
+    cases (or sizes) keeps the baseline of the others. Returns the merged results.
+    """
+    merged = {}
+    if os.path.exists(path):
+        with open(path, "r") as file:
+            merged = json.load(file)["results"]
+
+    for name, sizes in results.items():
+        merged.setdefault(name, {}).update(sizes)
+    return merged
+
+
+# ---------------------------------------------------------
+# Main Program
+# ---------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Run the portfolio benchmark suite.")
+    parser.add_argument("--case", action="append", choices=sorted(CASES),
+                        help="case to run (repeatable, default: all)")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every input size by this")
+    parser.add_argument("--repeat", type=int, default=15, help="timed runs per size (the median is kept)")
+    parser.add_argument("--output", default=default_output, help="where to write the JSON results")
+    parser.add_argument("--baseline", default=default_baseline, help="baseline JSON to compare with")
+    parser.add_argument("--time-threshold", type=float, default=0.5, help="allowed slowdown, e.g. 0.5 = 50%%")
+    parser.add_argument("--memory-threshold", type=float, default=0.25,
+                        help="allowed growth of peak memory, e.g. 0.25 = 25%%")
+    parser.add_argument("--update-baseline", action="store_true", help="merge the results into the baseline")
+    args = parser.parse_args()
+
+    print(f"{'Case':<20}{'Size':>10}{'Median time':>17}{'Peak memory':>18}")
+    print("-" * 65)
+    results = run_cases(args.case or list(CASES), args.scale, args.repeat)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": merge_baseline(args.baseline, results) if args.update_baseline else results,
+    }
+
+    output = args.baseline if args.update_baseline else args.output
+    with open(output, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.update_baseline or not os.path.exists(args.baseline):
+        return 0
+
+    with open(args.baseline, "r") as file:
+        baseline = json.load(file)["results"]
+
+    regressions, compared = find_regressions(results, baseline, args.time_threshold, args.memory_threshold)
+    total = sum(len(sizes) for sizes in results.values())
+    if compared < total:
+        print(f"\nWarning: {total - compared} of {total} result(s) have no baseline at that size "
+              f"and were not compared.")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.time_threshold:.0%} (time) "
+              f"or {args.memory_threshold:.0%} (memory):")
+        for message in regressions:
+            print(f"  • {message}")
+        return 1
+
+    if compared == 0:
+        print("Nothing was compared with the baseline, so no regressions could be checked.")
+        return 0
+
+    print(f"No regressions beyond {args.time_threshold:.0%} (time) or {args.memory_threshold:.0%} (memory) "
+          f"in {compared} result(s) compared with the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# ============== END OF CODE ==============